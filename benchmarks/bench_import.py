@@ -0,0 +1,17 @@
+class Import:
+    "Startup time of the package and of the first access to its attributes."
+
+    params = [
+        None,
+        "Rainflow",
+        "create_test_specimen",
+        "fiber_reinforced_rubber",
+        "simulate_test_specimen",
+    ]
+    param_names = ["attribute"]
+
+    def timeraw_import(self, attribute):
+        code = "import fiberreinforcedrubber as frr"
+        if attribute is not None:
+            code += f"; frr.{attribute}"
+        return code
@@ -0,0 +1,59 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+class Interpolate:
+    "Interpolation of point values of the rubber mesh to a fiber family."
+
+    params = ([51, 201, 501], ["linear", "isoparametric"])
+    param_names = ["n", "method"]
+
+    def setup(self, n, method):
+        mesh, fibers_1, fibers_2, mask_1, mask_2 = frr.create_test_specimen(n=n)
+        self.mesh, self.fibers, self.mask = mesh, fibers_1, mask_1
+        self.values = np.random.default_rng(5).random((mesh.npoints, 2))
+        self.interpolator = frr.Interpolator(mesh, fibers_1, mask_1, method=method)
+
+    def time_interpolator(self, n, method):
+        frr.Interpolator(self.mesh, self.fibers, self.mask, method=method)
+
+    def time_interpolate(self, n, method):
+        self.interpolator(self.values)
+
+    def peakmem_interpolator(self, n, method):
+        frr.Interpolator(self.mesh, self.fibers, self.mask, method=method)
+
+
+class FiberForce:
+    "Projection of the fiber forces from the quadrature-points to the mesh-points."
+
+    params = [False, True]
+    param_names = ["projector"]
+
+    def setup(self, projector):
+        mesh = frr.create_test_specimen(n=51)[0]
+        region = fem.RegionQuad(mesh)
+        field = fem.FieldContainer([fem.Field(region, dim=2)])
+        field[0].values[:] = 0.01 * mesh.points[:, ::-1]
+
+        self.material, self.fibermat1, fibermat2, self.vector1, vector2 = (
+            frr.fiber_reinforced_rubber(fused=True)
+        )
+        self.solid = fem.SolidBody(self.material, field)
+        self.solid.assemble.vector(field)
+
+        self.projector = None
+        if projector:
+            self.projector = frr.Projector(region)
+
+    def time_fiber_force(self, projector):
+        frr.fiber_force(
+            self.solid, 5, 0.08, self.vector1, self.projector, self.fibermat1
+        )
+
+    def peakmem_fiber_force(self, projector):
+        frr.fiber_force(
+            self.solid, 5, 0.08, self.vector1, self.projector, self.fibermat1
+        )
@@ -0,0 +1,49 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+class MaterialEvaluation:
+    "Evaluation of the gradient and the hessian of the combined material formulation."
+
+    params = [False, True]
+    param_names = ["compiled"]
+
+    def setup(self, compiled):
+        self.umat = frr.fiber_reinforced_rubber(fused=True, compiled=compiled)[0]
+
+        rng = np.random.default_rng(5)
+        self.F = np.eye(2).reshape(2, 2, 1, 1) + 0.1 * rng.normal(size=(2, 2, 4, 5000))
+
+    def time_fiber_reinforced_rubber(self, compiled):
+        frr.fiber_reinforced_rubber(fused=True, compiled=compiled)
+
+    def time_gradient(self, compiled):
+        self.umat.gradient([self.F])
+
+    def time_hessian(self, compiled):
+        self.umat.hessian([self.F])
+
+
+class MaterialBatch:
+    "Batched evaluation of the material formulation for variants of the parameters."
+
+    params = [1, 10, 50]
+    param_names = ["nvariants"]
+
+    def setup(self, nvariants):
+        self.umat = frr.FiberReinforcedRubberBatch(
+            fiber_angle=np.linspace(0, 45, nvariants)
+        )
+
+        rng = np.random.default_rng(5)
+        self.F = np.eye(2).reshape(2, 2, 1, 1) + 0.1 * rng.normal(size=(2, 2, 4, 1000))
+
+    def time_gradient(self, nvariants):
+        self.umat.gradient([self.F])
+
+    def time_hessian(self, nvariants):
+        self.umat.hessian([self.F])
+
+    def peakmem_hessian(self, nvariants):
+        self.umat.hessian([self.F])
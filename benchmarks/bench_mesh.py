@@ -0,0 +1,50 @@
+import fiberreinforcedrubber as frr
+from fiberreinforcedrubber._fibers import fibers
+from fiberreinforcedrubber._rubber import rubber
+
+
+class Rubber:
+    "Mesh generation of the rubber."
+
+    def time_rubber(self):
+        rubber(width=50, height=50, middle=5, radius=20, angle=120)
+
+    def peakmem_rubber(self):
+        rubber(width=50, height=50, middle=5, radius=20, angle=120)
+
+
+class Fibers:
+    "Mesh generation of a fiber family."
+
+    params = ([51, 201, 501], [1.0, 0.5])
+    param_names = ["n", "fiber_distance"]
+
+    def setup(self, n, fiber_distance):
+        self.mesh, self.limit = rubber(
+            width=50, height=50, middle=5, radius=20, angle=120
+        )
+
+    def time_fibers(self, n, fiber_distance):
+        fibers(self.limit, fiber_distance=fiber_distance, n=n)
+
+    def time_fibers_compact(self, n, fiber_distance):
+        fibers(self.limit, fiber_distance=fiber_distance, n=n, compact=True)
+
+    def peakmem_fibers(self, n, fiber_distance):
+        fibers(self.limit, fiber_distance=fiber_distance, n=n)
+
+
+class TestSpecimen:
+    "Mesh generation of the test specimen (rubber and both fiber families)."
+
+    params = ([51, 201, 501], [1.0, 0.5])
+    param_names = ["n", "fiber_distance"]
+
+    def time_create_test_specimen(self, n, fiber_distance):
+        frr.create_test_specimen(n=n, fiber_distance=fiber_distance)
+
+    def time_create_test_specimen_compact(self, n, fiber_distance):
+        frr.create_test_specimen(n=n, fiber_distance=fiber_distance, compact=True)
+
+    def peakmem_create_test_specimen(self, n, fiber_distance):
+        frr.create_test_specimen(n=n, fiber_distance=fiber_distance)
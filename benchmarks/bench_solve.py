@@ -0,0 +1,59 @@
+import felupe as fem
+from pypardiso import spsolve
+
+import fiberreinforcedrubber as frr
+from fiberreinforcedrubber._rubber import rubber
+
+
+class NewtonIteration:
+    "One Newton-Raphson iteration (assembly and solution of the linear system)."
+
+    params = ([False, True], ["spsolve", "pardiso"])
+    param_names = ["fused", "solver"]
+
+    def setup(self, fused, solver):
+        mesh, limit = rubber(width=50, height=50, middle=5, radius=20, angle=120)
+        region = fem.RegionQuad(mesh)
+        self.field = fem.FieldContainer([fem.Field(region, dim=2)])
+
+        self.bounds, loadcase = fem.dof.shear(self.field)
+        self.bounds["compression_top"].value = 1
+        self.dof0, self.dof1 = fem.dof.partition(self.field, self.bounds)
+        self.ext0 = fem.dof.apply(self.field, self.bounds, self.dof0)
+
+        material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+            fused=fused
+        )
+        if fused:
+            self.solids = [fem.SolidBody(material, self.field)]
+        else:
+            self.solids = [
+                fem.SolidBody(umat, self.field)
+                for umat in [material, fibermat1, fibermat2]
+            ]
+
+        self.solver = spsolve
+        if solver == "pardiso":
+            self.solver = frr.PardisoSolver()
+
+    def time_newton_iteration(self, fused, solver):
+        vectors = [solid.assemble.vector(self.field) for solid in self.solids]
+        matrices = [solid.assemble.matrix(self.field) for solid in self.solids]
+        system = fem.solve.partition(
+            self.field, sum(matrices), self.dof1, self.dof0, sum(vectors)
+        )
+        fem.solve.solve(*system, self.ext0, solver=self.solver)
+
+
+class CharacteristicCurve:
+    "Force-displacement characteristic curves under tension and shear."
+
+    number = 1
+    repeat = 1
+    timeout = 600
+
+    def time_characteristic_curve(self):
+        frr.simulate_test_specimen()
+
+    def peakmem_characteristic_curve(self):
+        frr.simulate_test_specimen()
@@ -1,12 +1,54 @@
+import importlib
+
 from .__about__ import __version__
-from ._helpers import fiber_force, interpolate
-from ._materials import fiber_reinforced_rubber
-from ._test_specimen import create_test_specimen
-
-__all__ = [
-    "create_test_specimen",
-    "interpolate",
-    "fiber_force",
-    "fiber_reinforced_rubber",
-    "__version__",
-]
+
+# public attributes and their (private) modules, imported on first access
+_modules = {
+    "create_test_specimen": "_test_specimen",
+    "MeshCache": "_cache",
+    "interpolate": "_helpers",
+    "Interpolator": "_helpers",
+    "locate": "_locate",
+    "shape_functions": "_locate",
+    "fiber_force": "_helpers",
+    "Projector": "_helpers",
+    "FiberForceRange": "_accumulators",
+    "Rainflow": "_fatigue",
+    "rainflow_damage": "_fatigue",
+    "basquin": "_fatigue",
+    "fiber_reinforced_rubber": "_materials",
+    "FiberReinforcedRubberBatch": "_materials",
+    "compiled_material": "_kernels",
+    "KernelCache": "_kernels",
+    "simulate_test_specimen": "_simulation",
+    "sweep": "_sweep",
+    "parameter_grid": "_sweep",
+    "Profiler": "_profiling",
+    "PardisoSolver": "_solver",
+    "PointSymmetry": "_symmetry",
+    "Continuation": "_continuation",
+    "AdaptiveSteps": "_stepping",
+    "force_control": "_control",
+    "ResultsWriter": "_results",
+    "read_results": "_results",
+    "Checkpoint": "_checkpoint",
+    "branches": "_branches",
+    "Surrogate": "_surrogate",
+}
+
+__all__ = [*_modules.keys(), "__version__"]
+
+
+def __getattr__(name):
+    "Import the module of a public attribute on first access (PEP 562)."
+
+    if name in _modules:
+        value = getattr(importlib.import_module(f".{_modules[name]}", __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals().keys(), *_modules.keys()})
@@ -0,0 +1,117 @@
+import felupe as fem
+import numpy as np
+
+from ._helpers import fiber_force
+
+
+class FiberForceRange(fem.Plugin):
+    """A streaming accumulator of the fiber forces of both fiber families, to be used
+    as plugin of a job, i.e. ``fem.Job(steps, plugins=[FiberForceRange(...)])``.
+
+    The running minimum and maximum of the fiber forces per undeformed (fiber) area
+    and the running maximum of the absolute difference between the two fiber families
+    are updated in-place (constant memory for any number of substeps). The fiber
+    forces are evaluated at the points of the rubber mesh, see ``fiber_force()``, and
+    optionally interpolated to the meshes of the fiber families by a list of
+    ``interpolators``. The difference is always evaluated at the points of the rubber
+    mesh. The forces of the first substep are kept for the double amplitude between
+    the first and the last substep.
+    """
+
+    # the accumulated attributes (e.g. for a checkpoint)
+    accumulated = ("nsubsteps", "first", "force", "min", "max", "difference")
+
+    def __init__(
+        self,
+        solid,
+        thickness,
+        fiber_area,
+        vectors,
+        projector=None,
+        umats=None,
+        interpolators=None,
+    ):
+        self.solid = solid
+        self.thickness = thickness
+        self.fiber_area = fiber_area
+        self.vectors = vectors
+        self.projector = projector
+        self.umats = umats
+        self.interpolators = interpolators
+
+        if self.umats is None:
+            self.umats = [None] * len(self.vectors)
+
+        # number of accumulated substeps, forces of the first and the last substep
+        self.nsubsteps = 0
+        self.first = [None] * len(self.vectors)
+        self.force = [None] * len(self.vectors)
+
+        self.min = [None] * len(self.vectors)
+        self.max = [None] * len(self.vectors)
+        self.difference = None
+
+    def update(self):
+        "Evaluate the fiber forces of the solid and update the accumulated values."
+
+        forces = [
+            fiber_force(
+                self.solid,
+                self.thickness,
+                self.fiber_area,
+                vector,
+                self.projector,
+                umat,
+            )
+            for vector, umat in zip(self.vectors, self.umats)
+        ]
+
+        # max. absolute difference between the fiber families (at the rubber mesh)
+        difference = np.abs(forces[0] - forces[1])
+
+        if self.interpolators is not None:
+            forces = [
+                interpolate(force)
+                for interpolate, force in zip(self.interpolators, forces)
+            ]
+
+        if self.nsubsteps == 0:
+            self.first = [force.copy() for force in forces]
+            self.min = [force.copy() for force in forces]
+            self.max = [force.copy() for force in forces]
+            self.difference = difference
+
+        else:
+            for force, fmin, fmax in zip(forces, self.min, self.max):
+                np.fmin(fmin, force, out=fmin)
+                np.fmax(fmax, force, out=fmax)
+
+            np.fmax(self.difference, difference, out=self.difference)
+
+        self.force = forces
+        self.nsubsteps += 1
+
+    def after_substep(self, context, state):
+        "Update the accumulated values after a completed substep."
+        self.update()
+
+    @property
+    def range(self):
+        "The ranges of the fiber forces (per fiber family)."
+        return [fmax - fmin for fmin, fmax in zip(self.min, self.max)]
+
+    @property
+    def max_range(self):
+        "The max. range of the fiber forces of both fiber families."
+        return np.fmax(*self.range)
+
+    @property
+    def double_amplitude(self):
+        """The absolute differences of the fiber forces between the last and the first
+        substep (per fiber family), e.g. of a lateral ramp ``U = -23 ... 23`` mm."""
+        return [np.abs(last - first) for first, last in zip(self.first, self.force)]
+
+    @property
+    def max_double_amplitude(self):
+        "The max. double amplitude of the fiber forces of both fiber families."
+        return np.fmax(*self.double_amplitude)
@@ -0,0 +1,226 @@
+import inspect
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import felupe as fem
+import numpy as np
+
+from ._checkpoint import _restore, _snapshot
+from ._simulation import _model
+from ._solver import PardisoSolver
+from ._sweep import _stack, limit_threads
+
+# the model, the base step and the (shared) base state of a process of the pool
+_worker = {}
+
+
+def _share(data):
+    """Copy a dict of arrays to a block of shared memory. Returns the block and the
+    layout (key, shape, dtype and offset) of the arrays."""
+
+    layout = []
+    offset = 0
+
+    for key, value in data.items():
+        value = np.asarray(value)
+        layout.append((key, value.shape, value.dtype.str, offset))
+        offset += value.nbytes
+
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+
+    for (key, shape, dtype, start), value in zip(layout, data.values()):
+        np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)[...] = value
+
+    return block, layout
+
+
+def _attach(name, layout):
+    "Attach to a block of shared memory. Returns the block and the views of the arrays."
+
+    block = shared_memory.SharedMemory(name=name)
+    data = {
+        key: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)
+        for key, shape, dtype, start in layout
+    }
+
+    return block, data
+
+
+def _pretension(model, tension_max, num):
+    "The step of the pre-tension (``V = 0 ... tension_max``) at ``U = 0``."
+
+    field, bounds, constraints, solid, materials = model
+
+    return fem.Step(
+        items=[solid, *constraints],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: fem.math.linsteps([0, tension_max], num=num),
+            bounds["move"]: fem.math.linsteps([0, 0], num=num),
+        },
+    )
+
+
+def _branch(model, base, data, lateral, tension_max, thickness, solver, tol):
+    "Restore the base state and evaluate a lateral ramp at the constant tension."
+
+    field, bounds, constraints, solid, materials = model
+    _restore(data, base, field)
+
+    step = fem.Step(
+        items=[solid, *constraints],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: np.full(len(lateral), float(tension_max)),
+            bounds["move"]: lateral,
+        },
+    )
+    curve = fem.CharacteristicCurve(steps=[step], boundary=bounds["move"])
+    curve.evaluate(solver=solver, tol=tol, verbose=False)
+
+    forces = np.array(curve.y) * thickness
+
+    return {
+        "lateral": lateral,
+        "force_tensionshear": forces[:, 1],
+        "force_lateral": forces[:, 0],
+    }
+
+
+def _init(name, layout, parameters, tension_max, num):
+    "Create the model and attach to the shared base state in a process of the pool."
+
+    model = _model(**parameters)
+    block, data = _attach(name, layout)
+
+    _worker.update(
+        model=model,
+        base=_pretension(model, tension_max, num),
+        block=block,
+        data=data,
+        solver=PardisoSolver(),
+    )
+
+
+def _evaluate(lateral, tension_max, thickness, tol):
+    "Evaluate a branch in a process of the pool, catch and return an exception."
+
+    try:
+        result = _branch(
+            _worker["model"],
+            _worker["base"],
+            _worker["data"],
+            lateral,
+            tension_max,
+            thickness,
+            _worker["solver"],
+            tol,
+        )
+        return result, None
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def branches(
+    lateral,
+    tension_max=8,
+    num=None,
+    processes=None,
+    threads=1,
+    tol=1e-2,
+    **parameters,
+):
+    """Evaluate many lateral load paths (branches) of the test specimen, starting from
+    one shared pre-tensioned state.
+
+    The pre-tension (``V = 0 ... tension_max`` in ``num`` substeps at ``U = 0``) is
+    solved once. Its state, i.e. the values of the unknowns, the state variables and
+    the values of the boundaries, is copied to a block of shared memory. Each branch
+    restores this state and evaluates a ramp of the lateral displacement ``U`` at the
+    constant tension ``V = tension_max``. A branch is either a lateral amplitude (a
+    ramp ``U = 0 ... amplitude`` with steps of 1 mm) or a ramp of lateral
+    displacements, e.g. a cycle shape ``fem.math.linsteps([0, 23, -23, 0], num=23)``.
+    The geometry and material ``parameters`` are passed to the model, see
+    ``simulate_test_specimen()``.
+
+    The branches are evaluated on a pool of (spawned) processes, see ``sweep()``. The
+    model and the linear solver are created once per process and the processes
+    attach to the shared base state. If ``processes=0``, the branches are evaluated
+    one after another in the current process.
+
+    Returns a columnar results store with the displacement ``V`` and the force
+    ``F_Y`` of the pre-tension, and per branch the lateral displacements ``U`` and
+    the forces ``F_Y`` and ``F_X`` in N, along with the arrays ``success`` and
+    ``error``. The results of failed branches and of shorter branches are filled
+    with NaN.
+    """
+
+    # the geometry and material parameters with the defaults of the model
+    defaults = {
+        key: value.default
+        for key, value in inspect.signature(_model).parameters.items()
+    }
+    parameters = {**defaults, **parameters, "threads": threads}
+    thickness = parameters["thickness"]
+
+    if num is None:
+        num = int(np.ceil(tension_max))
+
+    if processes is None:
+        processes = max(1, (os.cpu_count() or 1) // threads)
+
+    ramps = []
+    for value in lateral:
+        if np.ndim(value) == 0:
+            value = fem.math.linsteps([0, value], num=int(np.ceil(abs(value))))
+        ramps.append(np.asarray(value, dtype=float))
+
+    # solve the pre-tension once
+    model = _model(**parameters)
+    field, bounds, constraints, solid, materials = model
+    base = _pretension(model, tension_max, num)
+    solver = PardisoSolver()
+
+    curve = fem.CharacteristicCurve(steps=[base], boundary=bounds["move"])
+    curve.evaluate(solver=solver, tol=tol, verbose=False)
+
+    data = {key: value.copy() for key, value in _snapshot(base, field).items()}
+
+    if processes == 0:
+        results = []
+        for ramp in ramps:
+            try:
+                args = (model, base, data, ramp, tension_max, thickness, solver, tol)
+                results.append((_branch(*args), None))
+            except Exception as error:
+                results.append((None, f"{type(error).__name__}: {error}"))
+
+    else:
+        block, layout = _share(data)
+
+        try:
+            # spawned processes inherit the limited number of threads on startup
+            with limit_threads(threads):
+                with ProcessPoolExecutor(
+                    max_workers=max(1, min(processes, len(ramps))),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init,
+                    initargs=(block.name, layout, parameters, tension_max, num),
+                ) as executor:
+                    args = [tension_max, thickness, tol]
+                    tasks = [ramps, *[itertools.repeat(a) for a in args]]
+                    results = list(executor.map(_evaluate, *tasks))
+        finally:
+            block.close()
+            block.unlink()
+
+    store = {
+        "displacement": np.array(curve.x)[:, 1],
+        "force_tension": np.array(curve.y)[:, 1] * thickness,
+    }
+    store.update(_stack(results))
+
+    return store
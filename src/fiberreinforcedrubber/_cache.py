@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import felupe as fem
+import numpy as np
+
+from .__about__ import __version__
+
+
+class MeshCache:
+    """A persistent content-addressed on-disk cache for the meshes of the test
+    specimen. Each entry is stored as an uncompressed ``.npz``-file, named by a hash
+    of the geometry arguments and the version of the package. The total size of the
+    cache is bounded by ``max_size`` (in bytes) with a least-recently-used eviction.
+
+    Entries are written to a temporary file first and then renamed, i.e. parallel
+    processes may share the same cache directory.
+    """
+
+    def __init__(self, path, max_size=2**30):
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, **kwargs):
+        "Return the hash of the given (geometry) arguments and the package version."
+
+        data = json.dumps(
+            {"version": __version__, **kwargs}, sort_keys=True, default=float
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def filename(self, key):
+        "Return the filename of a cache entry."
+
+        return os.path.join(self.path, f"{key}.npz")
+
+    def load(self, key):
+        """Return the cached meshes and point masks of a key or None if the key is not
+        in the cache."""
+
+        filename = self.filename(key)
+
+        try:
+            with np.load(filename) as data:
+                meshes = [
+                    fem.Mesh(
+                        data[f"points_{i}"],
+                        data[f"cells_{i}"],
+                        cell_type=str(data[f"cell_type_{i}"]),
+                    )
+                    for i in range(3)
+                ]
+                masks = [data["mask_points_1"], data["mask_points_2"]]
+
+            # mark the entry as recently used
+            os.utime(filename)
+
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+
+        return (*meshes, *masks)
+
+    def save(self, key, meshes):
+        "Store the meshes and point masks of a key and evict old entries."
+
+        mesh_rubber, mesh_fibers_1, mesh_fibers_2, mask_points_1, mask_points_2 = meshes
+
+        data = {}
+        for i, mesh in enumerate([mesh_rubber, mesh_fibers_1, mesh_fibers_2]):
+            data[f"points_{i}"] = mesh.points
+            data[f"cells_{i}"] = mesh.cells
+            data[f"cell_type_{i}"] = np.array(mesh.cell_type)
+
+        data["mask_points_1"] = mask_points_1
+        data["mask_points_2"] = mask_points_2
+
+        # write to a temporary file and rename it (atomic for parallel processes)
+        with tempfile.NamedTemporaryFile(
+            dir=self.path, suffix=".tmp", delete=False
+        ) as file:
+            np.savez(file, **data)
+
+        os.replace(file.name, self.filename(key))
+        self.evict()
+
+    def evict(self):
+        "Remove the least-recently-used entries until the cache fits ``max_size``."
+
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".npz"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry[1] for entry in entries)
+
+        for mtime, filesize, filename in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+            size -= filesize
+
+    def clear(self):
+        "Remove all entries of the cache."
+
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".npz"):
+                os.remove(entry.path)
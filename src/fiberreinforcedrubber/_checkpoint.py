@@ -0,0 +1,234 @@
+import json
+import os
+
+import felupe as fem
+import numpy as np
+
+
+def _attributes(obj):
+    """The array-like and numeric accumulated attributes of an object (e.g. of an
+    accumulator), given by the names of ``obj.accumulated`` (default: all)."""
+
+    attributes = {}
+    names = getattr(obj, "accumulated", vars(obj).keys())
+
+    for key in names:
+        value = getattr(obj, key)
+        if isinstance(value, (bool, int, float, np.ndarray, np.number)):
+            attributes[key] = value
+
+        elif (
+            isinstance(value, list)
+            and len(value) > 0
+            and all(isinstance(v, np.ndarray) for v in value)
+        ):
+            attributes[key] = list(value)
+
+    return attributes
+
+
+def _value(array):
+    "A scalar or a copy of a loaded array."
+    return array.item() if array.ndim == 0 else array.copy()
+
+
+def _items(step):
+    "The ramped items and the boundaries of a step (without duplicates)."
+
+    items = list(step.ramp.keys())
+    for boundary in step.boundaries.values():
+        if not any(boundary is item for item in items):
+            items.append(boundary)
+
+    return items
+
+
+def _snapshot(step, x0):
+    """A snapshot (dict of arrays) of the values of the unknowns, the state variables
+    of the items and the values of the ramped items and the boundaries of a step."""
+
+    data = {}
+
+    for i, field in enumerate(x0.fields):
+        data[f"x/{i}"] = field.values
+
+    for i, item in enumerate(step.items):
+        statevars = getattr(getattr(item, "results", None), "statevars", None)
+        if statevars is not None:
+            data[f"statevars/{i}"] = statevars
+
+    for i, item in enumerate(_items(step)):
+        value = getattr(item, "value", None)
+        if value is not None:
+            data[f"values/{i}"] = np.asarray(value)
+
+    return data
+
+
+def _restore(data, step, x0):
+    "Restore a snapshot for the items, the boundaries and the unknowns of a step."
+
+    for i, field in enumerate(x0.fields):
+        field.values[:] = data[f"x/{i}"]
+
+    for i, item in enumerate(step.items):
+        if f"statevars/{i}" in data:
+            item.results.statevars = data[f"statevars/{i}"].copy()
+            item.results._statevars = None
+
+        item.field.link(x0)
+
+    for i, item in enumerate(_items(step)):
+        if f"values/{i}" in data:
+            item.update(_value(data[f"values/{i}"]))
+
+
+class Checkpoint(fem.Plugin):
+    """A plugin for jobs which writes restartable checkpoints to a ``.npz``-file, e.g.
+    ``fem.Job(steps, plugins=[Checkpoint(filename)])``.
+
+    After every ``interval`` converged substeps and after the last substep of each
+    step, the values of the unknowns, the state variables of the items, the values of
+    the ramped items and the boundaries of the step, the position (step and substep)
+    and the accumulated attributes of the (history) ``accumulators`` (a dict, e.g. of
+    a ``FiberForceRange`` or a ``Rainflow``) are written to the file. The names of
+    the accumulated attributes are given by the attribute ``accumulated`` of an
+    accumulator, otherwise all array-like and numeric attributes are written.
+    Accumulators which are plugins of the job must precede the checkpoint in the list
+    of plugins. The file is replaced atomically, i.e. it always contains a complete
+    checkpoint.
+
+    An interrupted job is resumed by ``fem.Job(checkpoint.resume(steps), ...)``, where
+    ``steps`` are the steps of the original job. The last checkpoint is restored and
+    only the remaining substeps are returned. The position of the checkpoints of the
+    resumed job refers to the original steps. A checkpoint is restored without
+    resuming by :meth:`load`, e.g. to branch several load paths from one
+    pre-tensioned state.
+    """
+
+    def __init__(self, filename, interval=1, accumulators=None):
+        self.filename = filename
+        self.interval = interval
+        self.accumulators = accumulators
+        self.position = None
+        self.nsubsteps = 0
+
+        if self.accumulators is None:
+            self.accumulators = {}
+
+        # positions (step, first substep) of the steps of a resumed job
+        self._positions = None
+
+    def _position(self, stepnumber, substepnumber):
+        "The position of a substep of a (resumed) job in the original steps."
+
+        if self._positions is None:
+            return stepnumber, substepnumber
+
+        step, start = self._positions[stepnumber]
+        return step, start + substepnumber
+
+    def save(self, step, x0, position):
+        "Write a checkpoint of a converged substep of a step."
+
+        data = {"position": np.array(position), **_snapshot(step, x0)}
+
+        keys = {}
+        for label, accumulator in self.accumulators.items():
+            attributes = _attributes(accumulator)
+            keys[label] = {}
+
+            for key, value in attributes.items():
+                if isinstance(value, list):
+                    keys[label][key] = len(value)
+                    for k, v in enumerate(value):
+                        data[f"accumulators/{label}/{key}/{k}"] = v
+                else:
+                    keys[label][key] = None
+                    data[f"accumulators/{label}/{key}"] = value
+
+        data["accumulators"] = np.array(json.dumps(keys))
+
+        # write to a temporary file and replace the checkpoint atomically
+        tmp = f"{self.filename}.tmp"
+        with open(tmp, "wb") as file:
+            np.savez(file, **data)
+
+        os.replace(tmp, self.filename)
+        self.position = tuple(position)
+
+    def load(self, steps, x0=None):
+        """Restore the last checkpoint for the steps of the original job. Returns the
+        position (step and substep) of the checkpoint."""
+
+        with np.load(self.filename) as data:
+            position = tuple(int(p) for p in data["position"])
+            step = steps[position[0]]
+
+            if x0 is None:
+                field = steps[0].items[0].field
+                x0 = getattr(field, "x0", field)
+
+            _restore(data, step, x0)
+
+            # the number of substeps of the original steps up to the checkpoint
+            self.nsubsteps = (
+                sum(s.nsubsteps for s in steps[: position[0]]) + position[1] + 1
+            )
+
+            keys = json.loads(str(data["accumulators"]))
+
+            for label, attributes in keys.items():
+                accumulator = self.accumulators[label]
+
+                for key, length in attributes.items():
+                    name = f"accumulators/{label}/{key}"
+
+                    if length is None:
+                        value = _value(data[name])
+                    else:
+                        value = [data[f"{name}/{k}"].copy() for k in range(length)]
+
+                    setattr(accumulator, key, value)
+
+        self.position = position
+        self._positions = None
+
+        return position
+
+    def resume(self, steps, x0=None):
+        """Restore the last checkpoint and return the remaining steps of the original
+        job (with the remaining substeps of the step of the checkpoint)."""
+
+        stepnumber, substepnumber = self.load(steps, x0=x0)
+        step = steps[stepnumber]
+        start = substepnumber + 1
+
+        remaining = []
+        self._positions = []
+
+        if start < step.nsubsteps:
+            remaining.append(
+                fem.Step(
+                    items=step.items,
+                    ramp={item: value[start:] for item, value in step.ramp.items()},
+                    boundaries=step.boundaries,
+                )
+            )
+            self._positions.append((stepnumber, start))
+
+        for j, step in enumerate(steps[1 + stepnumber :]):
+            remaining.append(step)
+            self._positions.append((1 + stepnumber + j, 0))
+
+        return remaining
+
+    def after_substep(self, context, state):
+        "Write a checkpoint after every interval of substeps and after each step."
+
+        self.nsubsteps += 1
+        last = state.substepnumber + 1 == context.step.nsubsteps
+
+        if self.nsubsteps % self.interval == 0 or last:
+            position = self._position(state.stepnumber, state.substepnumber)
+            self.save(context.step, context.substep.x, position)
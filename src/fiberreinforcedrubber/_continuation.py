@@ -0,0 +1,115 @@
+import felupe as fem
+
+
+class Continuation(fem.Plugin):
+    """A plugin for jobs which warm-starts the substeps of a parameter variant by the
+    converged solutions of a previously solved (nearby) variant on the same mesh, e.g.
+    ``fem.CharacteristicCurve(steps, boundary, plugins=[continuation])``.
+
+    After each converged substep, the values of the unknowns are stored per job, step
+    and substep. Before a substep of the next variant, the stored values are used as
+    the initial guess instead of the solution of the previous substep, i.e. a
+    substep does not depend on the intermediate substeps of the load path. If the
+    Newton-Raphson method of a warm-started substep fails, the substep is solved
+    again, starting from the solution of the previous substep. The jobs of a
+    variant are counted, call :meth:`restart` before the first job of a variant.
+
+    The number of Newton-Raphson iterations, the warm-started substeps and the
+    substeps which fell back to the load path are counted.
+
+    Note that all substeps are still solved, i.e. converged substeps are not skipped
+    or merged (the substeps of ``simulate_test_specimen()`` are the output points of
+    the curves). Only the number of Newton-Raphson iterations per substep is reduced.
+    """
+
+    def __init__(self, extrapolate=True):
+        self.extrapolate = extrapolate
+        self.solutions = {}
+        self.history = {}
+        self.job = 0
+        self.iterations = 0
+        self.warm_starts = 0
+        self.fallbacks = 0
+
+        # values of the unknowns of the previous substep (for a fallback)
+        self._previous = None
+
+    def restart(self):
+        "Start a new variant, i.e. the next job is the first job of the variant."
+
+        self.job = 0
+
+    def _key(self, state):
+        return self.job, state.stepnumber, state.substepnumber
+
+    @staticmethod
+    def _link(context, values):
+        "Set the values of the unknowns and link the fields of the items."
+
+        for field, value in zip(context.x0.fields, values):
+            field.values[:] = value
+
+        for item in context.items or []:
+            item.field.link(context.x0)
+
+    def before_substep(self, context, state):
+        "Use the stored solution of the previous variant as the initial guess."
+
+        self._previous = None
+        key = self._key(state)
+        solution = self.solutions.get(key)
+
+        if solution is None:
+            return
+
+        # linear extrapolation of the solutions of the two previous variants
+        if self.extrapolate and key in self.history:
+            solution = [2 * u - v for u, v in zip(solution, self.history[key])]
+
+        fields = context.x0.fields
+
+        # the solution is only used for the same mesh
+        if [value.shape for value in solution] != [f.values.shape for f in fields]:
+            return
+
+        self._previous = [field.values.copy() for field in fields]
+        self._link(context, solution)
+        self.warm_starts += 1
+
+    def after_iteration(self, context, state):
+        "Count the Newton-Raphson iterations."
+
+        self.iterations += 1
+
+    def after_failed_substep(self, context, state):
+        "Solve a failed warm-started substep again, starting from the load path."
+
+        # the substep was not warm-started or it is already recovered
+        if self._previous is None or state.result is not None:
+            return
+
+        self._link(context, self._previous)
+        self._previous = None
+        self.fallbacks += 1
+
+        try:
+            state.result = context.solve(state.values)
+            state.error = None
+        except Exception as error:
+            state.error = error
+
+    def after_substep(self, context, state):
+        "Store the converged solution of the substep."
+
+        key = self._key(state)
+        values = [field.values.copy() for field in state.result.x.fields]
+
+        if key in self.solutions:
+            self.history[key] = self.solutions[key]
+
+        self.solutions[key] = values
+
+    def after_job(self, context, state):
+        "Count the jobs of a variant."
+
+        self.job += 1
@@ -0,0 +1,125 @@
+import felupe as fem
+import numpy as np
+
+
+def force_control(
+    field,
+    items,
+    boundaries,
+    boundary,
+    force,
+    axis=1,
+    reaction=None,
+    values=None,
+    guess=None,
+    rtol=1e-4,
+    maxiter=20,
+    **kwargs,
+):
+    """Solve for the prescribed displacement of a ``boundary`` (e.g.
+    ``bounds["compression_top"]``) which results in the requested reaction ``force``
+    (component ``axis``) on the ``reaction`` boundary (default ``boundary``).
+
+    The displacement is found by secant iterations, starting from the two values
+    given by ``guess`` (default: the current value of the boundary and an increment
+    of 1 mm). Each iteration solves one load case, starting from the converged state
+    of the previous iteration. If the Newton-Raphson method fails, the state of the
+    previous iteration is restored and the update of the displacement is halved.
+    The values of other boundaries are fixed by the dict ``values``. Keyword
+    arguments are passed to the Newton-Raphson method, e.g. the linear ``solver``.
+
+    Returns a dict with the ``displacement``, the reaction ``force`` vector and the
+    number of ``iterations`` of the secant method.
+    """
+
+    if reaction is None:
+        reaction = boundary
+
+    if values is None:
+        values = {}
+
+    if guess is None:
+        value = float(np.ravel(boundary.value)[0])
+        guess = [value, value + 1]
+
+    kwargs.setdefault("verbose", False)
+
+    def solve(value):
+        "Solve the load case for a displacement of the boundary."
+
+        step = fem.Step(
+            items=items,
+            boundaries=boundaries,
+            ramp={
+                boundary: np.array([value]),
+                **{b: np.array([v]) for b, v in values.items()},
+            },
+        )
+        for result in step.generate(x0=field, **kwargs):
+            pass
+
+        return fem.tools.force(result.x, result.fun, reaction)
+
+    def residual(value):
+        "Solve a load case (restore the previous state on failure)."
+
+        checkpoint = [f.values.copy() for f in field.fields]
+
+        try:
+            return solve(value)
+        except (fem.NewtonConvergenceError, ArithmeticError, np.linalg.LinAlgError):
+            for f, saved in zip(field.fields, checkpoint):
+                f.values[:] = saved
+
+            # link the fields of the items to the restored unknowns
+            for item in items:
+                item.field.link(field)
+
+            return None
+
+    x = list(guess)
+    y = []
+
+    for value in x:
+        r = residual(value)
+        if r is None:
+            raise fem.NewtonConvergenceError(
+                f"Force control failed: the initial guess {value} did not converge."
+            )
+        y.append(r)
+
+    for iteration in range(1, maxiter + 1):
+        (x0, x1), (f0, f1) = x[-2:], [r[axis] for r in y[-2:]]
+
+        if abs(f1 - force) <= rtol * abs(force):
+            return {"displacement": x1, "force": y[-1], "iterations": iteration}
+
+        # the secant is undefined for a flat response
+        if f1 == f0:
+            raise fem.NewtonConvergenceError(
+                f"Force control failed: the force {f1} did not change between the "
+                f"displacements {x0} and {x1}."
+            )
+
+        # secant update (halved after a failed load case)
+        update = (force - f1) * (x1 - x0) / (f1 - f0)
+
+        for _ in range(10):
+            r = residual(x1 + update)
+            if r is not None:
+                break
+            update /= 2
+
+        else:
+            raise fem.NewtonConvergenceError(
+                f"Force control failed: the displacement {x1 + update} did not "
+                "converge."
+            )
+
+        x.append(x1 + update)
+        y.append(r)
+
+    raise fem.NewtonConvergenceError(
+        f"Force control failed: the force {force} was not reached after {maxiter} "
+        f"iterations (last force {y[-1][axis]} at the displacement {x[-1]})."
+    )
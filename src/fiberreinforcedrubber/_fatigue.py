@@ -0,0 +1,161 @@
+import numpy as np
+
+
+def basquin(exponent, reference_range, reference_cycles=1, endurance_limit=0):
+    """Return the damage per cycle function of a Basquin S-N curve, i.e. the inverse
+    of the number of cycles to failure ``N = N_ref (S / S_ref)^(-m)`` for a given
+    (force) range ``S``. Ranges below the endurance limit do not contribute."""
+
+    def damage(ranges):
+        "Damage per cycle for given ranges."
+        return np.where(
+            ranges > endurance_limit,
+            (ranges / reference_range) ** exponent / reference_cycles,
+            0.0,
+        )
+
+    return damage
+
+
+class Rainflow:
+    """A streaming rainflow cycle counter (ASTM E1049, three-point method) for the
+    histories of many points at once, e.g. the fiber forces of all (fiber) points.
+
+    The stacks of the reversals of all points are stored in one array. The
+    histories are processed in chunks of shape ``(nsteps, npoints)`` by
+    :meth:`update` with a loop over the time steps only, all points are processed at
+    once. The damage of the counted cycles is accumulated by the Palmgren-Miner rule
+    for a given damage per cycle function, see :func:`basquin`. The residual of the
+    stacks is counted as half cycles by :meth:`finish`. NaN-values are skipped.
+    """
+
+    # the accumulated attributes (e.g. for a checkpoint)
+    accumulated = ("stack", "size", "cycles", "max_range", "damage")
+
+    def __init__(self, npoints, damage=None, depth=16):
+        self.npoints = npoints
+        self.damage_per_cycle = damage
+
+        # stacks of the reversals and their sizes
+        self.stack = np.zeros((npoints, depth))
+        self.size = np.zeros(npoints, dtype=int)
+
+        # accumulated number of cycles, max. range and damage per point
+        self.cycles = np.zeros(npoints)
+        self.max_range = np.zeros(npoints)
+        self.damage = np.zeros(npoints)
+
+    def count(self, points, ranges, cycles):
+        "Count (half) cycles with given ranges for a list of (unique) points."
+
+        self.cycles[points] += cycles
+        self.max_range[points] = np.maximum(self.max_range[points], ranges)
+
+        if self.damage_per_cycle is not None:
+            self.damage[points] += cycles * self.damage_per_cycle(ranges)
+
+    def push(self, values):
+        "Add the values of a time step to the stacks and count the closed cycles."
+
+        size = self.size
+
+        if np.any(size == self.stack.shape[1]):
+            self.stack = np.hstack([self.stack, np.zeros_like(self.stack)])
+
+        # flat view of the stacks and the (flat) offsets of the points
+        depth = self.stack.shape[1]
+        stack = self.stack.reshape(-1)
+        offset = np.arange(0, self.npoints * depth, depth)
+
+        last = stack[offset + np.maximum(size - 1, 0)]
+        previous = stack[offset + np.maximum(size - 2, 0)]
+
+        # skip repeated values, extend monotonic segments, push reversals
+        skip = np.isnan(values) | ((size > 0) & (values == last))
+        extend = ~skip & (size > 1) & ((last - previous) * (values - last) > 0)
+        push = np.flatnonzero(~skip & ~extend)
+        extend = np.flatnonzero(extend)
+
+        stack[offset[extend] + size[extend] - 1] = values[extend]
+        stack[offset[push] + size[push]] = values[push]
+        size[push] += 1
+
+        # count the cycles of all changed stacks with (at least) three reversals
+        active = np.flatnonzero(~skip & (size >= 3))
+
+        while len(active) > 0:
+            top = offset[active] + size[active] - 1
+            X = abs(stack[top] - stack[top - 1])
+            Y = abs(stack[top - 2] - stack[top - 1])
+
+            closed = X >= Y
+            active, top, Y = active[closed], top[closed], Y[closed]
+
+            # ranges which contain the starting point are counted as half cycles
+            half = size[active] == 3
+            self.count(active, Y, np.where(half, 0.5, 1.0))
+
+            # remove the starting point (half cycles) or the two points of the cycle
+            first = offset[active[half]]
+            stack[first] = stack[first + 1]
+            stack[first + 1] = stack[first + 2]
+            stack[top[~half] - 2] = stack[top[~half]]
+            size[active] -= np.where(half, 1, 2)
+
+            active = active[size[active] >= 3]
+
+    def update(self, values):
+        "Process a chunk of the histories of shape ``(nsteps, npoints)``."
+
+        for step in np.asarray(values, dtype=float).reshape(-1, self.npoints):
+            self.push(step)
+
+        return self
+
+    def finish(self):
+        "Count the residual of the stacks as half cycles and reset the stacks."
+
+        for i in range(1, self.stack.shape[1]):
+            points = np.flatnonzero(self.size > i)
+            ranges = abs(self.stack[points, i] - self.stack[points, i - 1])
+            self.count(points, ranges, np.full(len(points), 0.5))
+
+        self.size[:] = 0
+
+        return self
+
+
+def rainflow_damage(
+    history, damage=None, exponent=5, reference_range=1, reference_cycles=1
+):
+    """Return the accumulated (Palmgren-Miner) damage, the number of cycles and the
+    max. ranges of the rainflow-counted cycles for all points of a history of shape
+    ``(nsteps, npoints)``.
+
+    The history may also be an iterable of chunks of shape ``(nsteps, npoints)``,
+    e.g. the blocks of a variable-amplitude load spectrum, which are processed one
+    after another (i.e. the full history is not required to fit into memory). An
+    empty iterable raises a ``ValueError``. If no ``damage`` per cycle function is
+    given, a Basquin S-N curve is used.
+    """
+
+    if isinstance(history, np.ndarray):
+        history = [history]
+
+    if damage is None:
+        damage = basquin(exponent, reference_range, reference_cycles)
+
+    rainflow = None
+
+    for chunk in history:
+        chunk = np.asarray(chunk, dtype=float)
+        if rainflow is None:
+            rainflow = Rainflow(np.prod(chunk.shape[1:], dtype=int), damage=damage)
+        rainflow.update(chunk)
+
+    if rainflow is None:
+        raise ValueError("The history does not contain any chunk.")
+
+    rainflow.finish()
+
+    return rainflow.damage, rainflow.cycles, rainflow.max_range
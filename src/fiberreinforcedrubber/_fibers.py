@@ -3,10 +3,27 @@ import numpy as np
 
 
 def fibers(
-    limit, width=50, height=50, middle=5, angle=15, axis=1, fiber_distance=1.0, n=201
+    limit,
+    width=50,
+    height=50,
+    middle=5,
+    angle=15,
+    axis=1,
+    fiber_distance=1.0,
+    n=201,
+    compact=False,
 ):
     """A mesh of a fiber family rotated by ``angle`` around a given
     ``axis``. Each fiber consists of ``(n-1)`` line-cells.
+
+    The fibers are sampled on a grid of lines, rotated around the center of the grid.
+    Each line is clipped analytically to the height of the test specimen, only the
+    remaining points are checked against the outline given by the ``limit`` function.
+
+    If ``compact=False``, all points of the grid are returned along with a mask of the
+    points located inside the test specimen. If ``compact=True``, only the points of
+    the fibers inside the test specimen are returned along with their indices in the
+    (non-compact) grid of points.
     """
 
     # fiber mesh parameters
@@ -14,44 +31,70 @@ def fibers(
     W = 2 * width
     center = np.array([H / 2, W / 2])
 
-    # init the grid and create the points in 2d-space
-    x, y = np.meshgrid(
-        np.linspace(0, H, n), np.arange(0, W + fiber_distance, fiber_distance)
-    )
-    points = np.vstack((x.ravel(), y.ravel())).T
-
-    # connect points to lines
-    cells = np.repeat(np.arange(0, len(points)), 2)[1:-1].reshape(-1, 2)
-    mask = np.ones(len(cells), dtype=bool)
-    mask[np.arange(0, len(cells), n)[1:] - 1] = False
-    cells = cells[mask]
-
-    mesh = fem.Mesh(points, cells, "line")
+    # init the grid of lines in 2d-space
+    x = np.linspace(0, H, n)
+    y = np.arange(0, W + fiber_distance, fiber_distance)
 
     # mean angle from given axis
     angle_mean = {0: 0, 1: 90}[axis]
+    rotation = fem.math.rotation_matrix(angle_mean + angle, dim=2)
 
-    # create two meshes for the fibers
-    fibers = fem.mesh.rotate(mesh, angle_deg=angle_mean + angle, axis=2, center=center)
+    # clip the lines to the height of the test specimen: the rotated y-coordinates
+    # of the points of a line are given by ``a * (x - center[0]) + b``
+    a = rotation[1, 0]
+    b = rotation[1, 1] * (y - center[1])
+    if np.isclose(a, 0):
+        inside = abs(b) <= height / 2 + fiber_distance
+        first = np.where(inside, 0, n)
+        last = np.where(inside, n - 1, -1)
+    else:
+        bounds = np.sort([(-height / 2 - b) / a, (height / 2 - b) / a], axis=0)
+        bounds = (center[0] + bounds) / (H / (n - 1))
+        first = np.clip(np.floor(bounds[0]).astype(int) - 1, 0, n)
+        last = np.clip(np.ceil(bounds[1]).astype(int) + 1, -1, n - 1)
 
-    # subtract the center
-    fibers.points -= center
+    # indices of the candidate points of the clipped lines
+    counts = np.maximum(last - first + 1, 0)
+    line = np.repeat(np.arange(len(y)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    column = first[line] + local
+    index = line * n + column
+
+    def rotate(points):
+        "Rotate the points around the center and subtract the center."
+        # keep the rounding of ``fem.mesh.rotate()``, i.e. of the points on the edges
+        return (rotation @ (points - center).T).T + center - center
 
     # cut out the test specimen (with the limit function in x)
-    p = fibers.points
-    mask_points = np.logical_and(
+    p = rotate(np.vstack((x[column], y[line])).T)
+    mask = np.logical_and(
         np.logical_and(
-            p[:, 0] >= -limit(fibers.points[:, 1]),
-            p[:, 0] <= limit(fibers.points[:, 1]),
+            p[:, 0] >= -limit(p[:, 1]),
+            p[:, 0] <= limit(p[:, 1]),
         ),
         np.logical_and(
             p[:, 1] >= -height / 2,
             p[:, 1] <= height / 2,
         ),
     )
-    points_to_keep = np.arange(len(p))[mask_points]
-    mask_cells = np.all(np.isin(fibers.cells, points_to_keep), axis=1)
 
-    fibers = fem.Mesh(fibers.points, fibers.cells[mask_cells], cell_type="line")
+    # connect subsequent points of a line to line-cells if both points are kept
+    keep = mask[:-1] & mask[1:] & (column[:-1] < n - 1) & (index[1:] == index[:-1] + 1)
+    cells = np.arange(len(index) - 1)[keep]
+    cells = np.vstack([cells, cells + 1]).T
+
+    if compact:
+        # keep only the points connected to line-cells
+        points, cells = np.unique(cells, return_inverse=True)
+        fibers = fem.Mesh(p[points], cells.reshape(-1, 2), cell_type="line")
+        return fibers, index[points]
+
+    # all points of the grid and the mask of the points inside the test specimen
+    xx, yy = np.meshgrid(x, y)
+    mask_points = np.zeros(len(y) * n, dtype=bool)
+    mask_points[index[mask]] = True
+    fibers = fem.Mesh(
+        rotate(np.vstack((xx.ravel(), yy.ravel())).T), index[cells], cell_type="line"
+    )
 
     return fibers, mask_points
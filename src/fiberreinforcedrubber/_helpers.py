@@ -1,22 +1,149 @@
 import felupe as fem
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.linalg import factorized
+from scipy.spatial import Delaunay
 
+from ._locate import locate, shape_functions
 
-def interpolate(mesh, values, fibers, mask):
+
+class Interpolator:
+    """An interpolation operator from the points of a source mesh to the (masked)
+    points of a fiber mesh. The interpolation weights are evaluated once and stored
+    as a sparse matrix, i.e. each call is a single sparse matrix-vector product.
+
+    With ``method="linear"``, the barycentric weights of a Delaunay triangulation of
+    the mesh-points are used. With ``method="isoparametric"``, the fiber points are
+    located in the cells of the mesh and the weights are given by the shape functions
+    of the cells, i.e. the interpolated values match the finite element field exactly.
+    """
+
+    def __init__(self, mesh, fibers, mask=None, method="linear"):
+        if mask is None:
+            mask = np.ones(len(fibers.points), dtype=bool)
+
+        self.mask = mask
+        self.npoints = len(fibers.points)
+
+        points = fibers.points[mask]
+
+        if method == "linear":
+            # locate the (masked) fiber points in the triangulation of the mesh-points
+            triangulation = Delaunay(mesh.points)
+            simplex = triangulation.find_simplex(points)
+            self.outside = simplex < 0
+
+            # barycentric coordinates of the fiber points
+            transform = triangulation.transform[simplex]
+            dim = points.shape[1]
+            weights = np.einsum(
+                "pij,pj->pi", transform[:, :dim], points - transform[:, dim]
+            )
+            weights = np.hstack([weights, 1 - weights.sum(axis=1, keepdims=True)])
+            cells = triangulation.simplices[simplex]
+
+        elif method == "isoparametric":
+            # locate the (masked) fiber points in the cells of the mesh
+            cell, rs = locate(mesh, points)
+            self.outside = cell < 0
+
+            # shape functions of the cells evaluated at the fiber points
+            weights = shape_functions(mesh.cell_type, rs.T)[0].T
+            cells = mesh.cells[cell]
+
+        else:
+            raise ValueError(f"Interpolation method {method} is not supported.")
+
+        weights[self.outside] = 0
+
+        # sparse interpolation matrix
+        rows = np.repeat(np.arange(len(points)), cells.shape[1])
+        self.matrix = csr_matrix(
+            (weights.ravel(), (rows, cells.ravel())),
+            shape=(len(points), len(mesh.points)),
+        )
+
+    def __call__(self, values):
+        "Interpolate values from the source mesh to the fiber mesh."
+
+        values = np.asarray(values)
+        v = self.matrix @ values.reshape(len(values), -1)
+        v[self.outside] = np.nan
+
+        u = np.zeros((self.npoints, *values.shape[1:]))
+        u[self.mask] = v.reshape(-1, *values.shape[1:])
+
+        return u
+
+
+def interpolate(mesh, values, fibers, mask=None, method="linear"):
     "Interpolate values from the source mesh to a fiber mesh."
 
-    u = np.zeros_like(fibers.points)
-    u[mask] = griddata(mesh.points, values, fibers.points[mask])
+    return Interpolator(mesh, fibers, mask, method=method)(values)
+
+
+class Projector:
+    """A projection operator of values at the quadrature-points of cells to the
+    mesh-points of a region. The (volume) matrix and the right-hand-side operator are
+    assembled once and the matrix is factorized once, i.e. each call is a sparse
+    matrix-vector product followed by a forward-backward substitution.
+
+    With ``lumped=True``, the row-sums of the volume matrix are used instead of the
+    consistent volume matrix, i.e. no factorization is required.
+    """
+
+    def __init__(self, region, lumped=False):
+        cells = region.mesh.cells
+        h = np.broadcast_to(region.h, (*region.h.shape[:2], cells.shape[0]))
+        dV = region.dV
+
+        # sparse matrices of the shape functions (with and without volumes)
+        # evaluated at the quadrature-points, rows: mesh-points, columns: (q, c)
+        rows = np.broadcast_to(cells.T[:, None, :], h.shape).ravel()
+        cols = np.broadcast_to(np.arange(dV.size).reshape(dV.shape), h.shape).ravel()
+        shape = (region.mesh.npoints, dV.size)
+        self.rhs = csr_matrix(((h * dV).ravel(), (rows, cols)), shape=shape)
+        H = csr_matrix((h.ravel(), (rows, cols)), shape=shape)
+
+        # volume matrix, fix diagonal items for points not connected to cells
+        A = self.rhs @ H.T
+        if lumped:
+            A = diags(np.asarray(A.sum(axis=1)).ravel())
+        A = A + diags((A.diagonal() == 0).astype(float))
+
+        if lumped:
+            diagonal = A.diagonal()
+            self.solve = lambda b: b / diagonal
+        else:
+            self.solve = factorized(A.tocsc())
+
+    def __call__(self, values):
+        "Project values at quadrature-points of cells to mesh-points."
+
+        shape = values.shape[:-2]
+        b = self.rhs @ values.reshape(-1, self.rhs.shape[1]).T
+        x = np.hstack([self.solve(bi).reshape(-1, 1) for bi in b.T])
+
+        return x.reshape(-1, *shape)
+
+
+def fiber_force(solid, thickness, fiber_area, fiber_vector, projector=None, umat=None):
+    """Evaluate cell-based fiber forces and project them to mesh-points. A
+    :class:`Projector` may be passed to re-use the factorized projection matrix.
+
+    If a material formulation ``umat`` of the fiber family is given, the fiber stress
+    is evaluated with the kinematics of the solid body, e.g. for a solid body with a
+    combined material formulation of the rubber and both fiber families.
+    """
 
-    return u
+    stress = solid.results.stress[0]
 
+    if umat is not None:
+        stress = umat.gradient([*solid.results.kinematics, solid.results.statevars])[0]
 
-def fiber_force(solid, thickness, fiber_area, fiber_vector):
-    "Evaluate cell-based fiber forces and project them to mesh-points."
+    force = fem.math.dot(stress * thickness / fiber_area, fiber_vector, mode=(2, 1))
 
-    force = fem.math.dot(
-        solid.results.stress[0] * thickness / fiber_area, fiber_vector, mode=(2, 1)
-    )
+    if projector is None:
+        return fem.project(force, solid.field.region)
 
-    return fem.project(force, solid.field.region)
+    return projector(force)
@@ -0,0 +1,181 @@
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import tempfile
+import warnings
+from multiprocessing import cpu_count
+
+import casadi as ca
+import matadi as mat
+import numpy as np
+
+from .__about__ import __version__
+
+
+class CompiledMaterial:
+    """A plane stress hyperelastic material formulation with compiled kernels for the
+    gradient and the hessian of the strain energy function w.r.t. the (2x2)
+    deformation gradient, see :func:`compiled_material`.
+
+    The kernels are evaluated for all quadrature-points and cells by a mapped casadi
+    function. The signatures of the methods are compatible with the
+    ``MaterialHyperelasticPlaneStressIncompressible`` of matadi.
+    """
+
+    def __init__(self, gradient, hessian):
+        self._gradient = gradient
+        self._hessian = hessian
+
+    def _apply(self, fun, F, shape, threads):
+        "Map a kernel on the deformation gradients of shape ``(2, 2, ...)``."
+
+        trailing_axes = F.shape[2:]
+        N = int(np.prod(trailing_axes))
+
+        parallel = ("thread", threads) if threads > 1 else ()
+        out = fun.map(N, *parallel)(F.reshape(2, -1, order="F"))
+
+        return np.array(out).reshape(*shape, *trailing_axes, order="F")
+
+    def gradient(self, x, threads=cpu_count()):
+        "Return the first Piola-Kirchhoff stress tensor (and no state variables)."
+        return [self._apply(self._gradient, x[0], (2, 2), threads), None]
+
+    def hessian(self, x, threads=cpu_count()):
+        "Return the fourth-order elasticity tensor."
+        return [self._apply(self._hessian, x[0], (2, 2, 2, 2), threads)]
+
+
+class KernelCache:
+    """A persistent on-disk cache of compiled material kernels. Each entry is a shared
+    library, named by a hash of the model, its parameters and the versions of
+    the package, matadi and casadi.
+
+    The C-code is generated by casadi and compiled by ``compiler`` (default ``$CC``
+    or ``gcc``). Libraries are compiled to a temporary file first and then renamed,
+    i.e. parallel processes may share the same cache directory.
+    """
+
+    def __init__(self, path=None, compiler=None, flags=("-O3", "-fPIC", "-shared")):
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"), ".cache", "fiberreinforcedrubber", "kernels"
+            )
+
+        if compiler is None:
+            compiler = os.environ.get("CC", "gcc")
+
+        self.path = os.fspath(path)
+        self.compiler = compiler
+        self.flags = list(flags)
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, fun, **kwargs):
+        "Return the hash of a model function and its parameters."
+
+        try:
+            source = inspect.getsource(fun)
+        except (OSError, TypeError):
+            source = None
+
+        data = json.dumps(
+            {
+                "version": __version__,
+                "matadi": mat.__version__,
+                "casadi": ca.__version__,
+                "model": f"{fun.__module__}.{fun.__qualname__}",
+                "source": source,
+                "flags": self.flags,
+                **kwargs,
+            },
+            sort_keys=True,
+            default=float,
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def filename(self, key):
+        "Return the filename of the shared library of a cache entry."
+
+        suffix = ".dll" if os.name == "nt" else ".so"
+        return os.path.join(self.path, f"{key}{suffix}")
+
+    def load(self, key):
+        """Return the compiled gradient and hessian kernels of a key or None if the key
+        is not in the cache."""
+
+        filename = self.filename(key)
+
+        if not os.path.isfile(filename):
+            return None
+
+        return ca.external("g", filename), ca.external("h", filename)
+
+    def save(self, key, functions):
+        "Generate the C-code of casadi functions and compile it to a shared library."
+
+        with tempfile.TemporaryDirectory(dir=self.path) as tmp:
+            codegen = ca.CodeGenerator(f"kernels_{key}.c", {"with_header": False})
+            for function in functions:
+                codegen.add(function)
+            source = codegen.generate(tmp + os.sep)
+
+            library = os.path.join(tmp, os.path.basename(self.filename(key)))
+            subprocess.run(
+                [self.compiler, *self.flags, source, "-o", library],
+                check=True,
+                capture_output=True,
+            )
+
+            # rename the compiled library (atomic for parallel processes)
+            os.replace(library, self.filename(key))
+
+    def clear(self):
+        "Remove all entries of the cache."
+
+        for entry in os.scandir(self.path):
+            if entry.name.endswith((".so", ".dll")):
+                os.remove(entry.path)
+
+
+def _functions(fun, **kwargs):
+    """The casadi functions of the gradient and the hessian of the strain energy
+    function w.r.t. the (2x2) deformation gradient of a plane stress incompressible
+    material formulation (as in matadi)."""
+
+    x = mat.Variable("F", 2, 2)
+    F = ca.horzcat(ca.vertcat(x, ca.SX.zeros(1, 2)), ca.SX.zeros(3, 1))
+    F[2, 2] = 1 / ca.det(x)
+
+    hessian, gradient = ca.hessian(fun(F, **kwargs), x)
+
+    return [ca.Function("g", [x], [gradient]), ca.Function("h", [x], [hessian])]
+
+
+def compiled_material(fun, cache=None, **kwargs):
+    """Return a plane stress incompressible hyperelastic material formulation with
+    compiled kernels for a strain energy function ``fun(F, **kwargs)``.
+
+    The kernels are compiled once per model function and parameters and stored in a
+    :class:`KernelCache` (or a path). On a cache hit, the symbolic graph of the
+    material formulation is not created at all. If the compilation fails, a warning
+    is emitted and the (non-compiled) matadi material formulation is returned.
+    """
+
+    if not isinstance(cache, KernelCache):
+        cache = KernelCache(cache)
+
+    key = cache.key(fun, **kwargs)
+    kernels = cache.load(key)
+
+    if kernels is None:
+        try:
+            cache.save(key, _functions(fun, **kwargs))
+        except (OSError, subprocess.CalledProcessError) as error:
+            warnings.warn(f"Compilation of the material kernels failed: {error}")
+            return mat.MaterialHyperelasticPlaneStressIncompressible(fun, **kwargs)
+
+        kernels = cache.load(key)
+
+    return CompiledMaterial(*kernels)
@@ -0,0 +1,164 @@
+import numpy as np
+
+# local point coordinates of the quad elements (same ordering as in FElupe)
+element_points = {
+    "quad": np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=float),
+    "quad8": np.array(
+        [[-1, -1], [1, -1], [1, 1], [-1, 1], [0, -1], [1, 0], [0, 1], [-1, 0]],
+        dtype=float,
+    ),
+    "quad9": np.array(
+        [[-1, -1], [1, -1], [1, 1], [-1, 1], [0, -1], [1, 0], [0, 1], [-1, 0], [0, 0]],
+        dtype=float,
+    ),
+}
+
+
+def shape_functions(cell_type, rs):
+    """Evaluate the shape functions of shape ``(a, n)`` and their derivatives w.r.t.
+    the local coordinates of shape ``(a, 2, n)`` at points ``rs`` of shape ``(2, n)``
+    for a quad cell type (``"quad"``, ``"quad8"`` or ``"quad9"``)."""
+
+    if cell_type not in element_points:
+        raise TypeError(f"Cell type {cell_type} is not supported.")
+
+    ra, sa = element_points[cell_type].T.reshape(2, -1, 1)
+    r, s = rs
+
+    if cell_type == "quad":
+        h = (1 + ra * r) * (1 + sa * s) / 4
+        dhdr = ra * (1 + sa * s) / 4
+        dhds = sa * (1 + ra * r) / 4
+
+    elif cell_type == "quad8":
+        corner = (ra != 0) & (sa != 0)
+        edge_r = ra == 0
+
+        h = np.where(
+            corner,
+            (1 + ra * r) * (1 + sa * s) * (ra * r + sa * s - 1) / 4,
+            np.where(
+                edge_r, (1 - r**2) * (1 + sa * s) / 2, (1 + ra * r) * (1 - s**2) / 2
+            ),
+        )
+        dhdr = np.where(
+            corner,
+            ra * (1 + sa * s) * (2 * ra * r + sa * s) / 4,
+            np.where(edge_r, -r * (1 + sa * s), ra * (1 - s**2) / 2),
+        )
+        dhds = np.where(
+            corner,
+            sa * (1 + ra * r) * (ra * r + 2 * sa * s) / 4,
+            np.where(edge_r, sa * (1 - r**2) / 2, -s * (1 + ra * r)),
+        )
+
+    else:
+
+        def lagrange(x, xa):
+            "1d quadratic Lagrange polynomials and their derivatives."
+            return (
+                np.where(xa == 0, 1 - x**2, x * (x + xa) / 2),
+                np.where(xa == 0, -2 * x, x + xa / 2),
+            )
+
+        hr, dhr = lagrange(r, ra)
+        hs, dhs = lagrange(s, sa)
+        h, dhdr, dhds = hr * hs, dhr * hs, hr * dhs
+
+    return h, np.stack([dhdr, dhds], axis=1)
+
+
+def locate(mesh, points, tol=1e-6, maxiter=10, chunksize=200000):
+    """Locate points in the cells of a quad mesh. Return the indices of the
+    containing cells and the local (isoparametric) coordinates of the points.
+
+    A uniform grid of buckets over the bounding boxes of the cells is used as spatial
+    index. The local coordinates are obtained by a vectorized Newton-Raphson inverse
+    mapping for all candidate cells of a point. Points outside the mesh are marked by
+    a cell index of ``-1``.
+    """
+
+    points = np.asarray(points, dtype=float)
+    cells = mesh.cells
+    X = mesh.points[cells]
+
+    # bounding boxes of the cells
+    lower = X.min(axis=1)
+    upper = X.max(axis=1)
+
+    # uniform grid of buckets (with a spacing of the mean cell size)
+    origin = lower.min(axis=0)
+    spacing = np.mean(upper - lower)
+    shape = np.ceil((upper.max(axis=0) - origin) / spacing).astype(int) + 1
+
+    # assign the cells to all overlapping buckets (sorted by the bucket index)
+    first = np.floor((lower - origin) / spacing).astype(int)
+    last = np.floor((upper - origin) / spacing).astype(int)
+    nx, ny = (last - first + 1).T
+    counts = nx * ny
+    cell = np.repeat(np.arange(len(cells)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ix = first[cell, 0] + local % nx[cell]
+    iy = first[cell, 1] + local // nx[cell]
+    bucket = ix * shape[1] + iy
+    order = np.argsort(bucket, kind="stable")
+    bucket_cells = cell[order]
+    offsets = np.searchsorted(bucket[order], np.arange(np.prod(shape) + 1))
+
+    cells_located = -np.ones(len(points), dtype=int)
+    rs_located = np.zeros((len(points), 2))
+
+    for start in range(0, len(points), chunksize):
+        p = points[start : start + chunksize]
+
+        # buckets of the points (points outside the grid have no candidates)
+        index = np.floor((p - origin) / spacing).astype(int)
+        valid = np.all((index >= 0) & (index < shape), axis=1)
+        index = index[:, 0] * shape[1] + index[:, 1]
+        index[~valid] = 0
+
+        # candidate pairs of points and cells
+        counts = np.where(valid, offsets[index + 1] - offsets[index], 0)
+        point = np.repeat(np.arange(len(p)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate = bucket_cells[offsets[index[point]] + local]
+
+        # exclude candidates with bounding boxes not containing the point
+        eps = tol * spacing
+        inside = np.all(
+            (p[point] >= lower[candidate] - eps) & (p[point] <= upper[candidate] + eps),
+            axis=1,
+        )
+        point, candidate = point[inside], candidate[inside]
+
+        # vectorized Newton-Raphson inverse mapping of all candidate pairs
+        x = X[candidate].transpose(1, 2, 0)
+        rs = np.zeros((2, len(point)))
+        for iteration in range(maxiter):
+            h, dhdr = shape_functions(mesh.cell_type, rs)
+            residual = np.einsum("aip,ap->ip", x, h) - p[point].T
+            dxdr = np.einsum("aip,ajp->ijp", x, dhdr)
+            det = dxdr[0, 0] * dxdr[1, 1] - dxdr[0, 1] * dxdr[1, 0]
+            rs -= (
+                np.array(
+                    [
+                        dxdr[1, 1] * residual[0] - dxdr[0, 1] * residual[1],
+                        dxdr[0, 0] * residual[1] - dxdr[1, 0] * residual[0],
+                    ]
+                )
+                / det
+            )
+            rs = np.clip(rs, -2, 2)
+
+        # keep the first candidate cell which contains the point
+        h, dhdr = shape_functions(mesh.cell_type, rs)
+        residual = np.einsum("aip,ap->ip", x, h) - p[point].T
+        found = np.all(abs(rs) <= 1 + tol, axis=0) & np.all(
+            abs(residual) <= eps, axis=0
+        )
+        point, index = np.unique(point[found], return_index=True)
+
+        cells_located[start + point] = candidate[found][index]
+        rs_located[start + point] = rs.T[found][index]
+
+    return cells_located, rs_located
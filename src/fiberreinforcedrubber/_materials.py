@@ -1,6 +1,18 @@
 import matadi as mat
 import numpy as np
 
+from ._kernels import compiled_material
+
+
+def fiber_reinforced_rubber_model(F, C10, E, angle1, angle2, k=0, axis=2):
+    "Strain energy function of a neo-Hooke rubber and two fiber families."
+
+    return (
+        mat.models.neo_hooke(F, C10=C10)
+        + mat.models.fiber(F, E=E, angle=angle1, k=k, axis=axis)
+        + mat.models.fiber(F, E=E, angle=angle2, k=k, axis=axis)
+    )
+
 
 def fiber_reinforced_rubber(
     C10=0.5,
@@ -11,8 +23,27 @@ def fiber_reinforced_rubber(
     strain_exponent=0,
     axis=1,
     fiber_distance=1,
+    fused=False,
+    compiled=False,
+    cache=None,
 ):
-    """Constitutive material formulation for a fiber-reinforced rubber composite."""
+    """Constitutive material formulation for a fiber-reinforced rubber composite.
+
+    If ``fused=True``, the first returned material is a combined material formulation
+    of the rubber and both fiber families, i.e. only one solid body is required. The
+    returned fiber materials are then only used to evaluate the fiber stresses, see
+    ``fiber_force(..., umat=fiber1)``.
+
+    If ``compiled=True``, the kernels of the material formulations are compiled to
+    shared libraries, which are stored in a ``KernelCache`` (or a path) and re-used
+    across processes, see ``compiled_material()``.
+    """
+
+    def material(fun, **kwargs):
+        "Plane stress incompressible hyperelastic material formulation."
+        if compiled:
+            return compiled_material(fun, cache=cache, **kwargs)
+        return mat.MaterialHyperelasticPlaneStressIncompressible(fun, **kwargs)
 
     if axis == 1:
         fiber_axis = 90
@@ -26,19 +57,29 @@ def fiber_reinforced_rubber(
     factor = fiber_area / (fiber_distance / np.cos(a)) / thickness
 
     # isotropic hyperelastic material formulation for the rubber
-    rubber = mat.MaterialHyperelasticPlaneStressIncompressible(
-        mat.models.neo_hooke, C10=C10
-    )
+    if fused:
+        # combined material formulation for the rubber and both fiber families
+        rubber = material(
+            fiber_reinforced_rubber_model,
+            C10=C10,
+            E=fiber_modulus * factor,
+            angle1=fiber_axis - fiber_angle,
+            angle2=fiber_axis + fiber_angle,
+            k=strain_exponent,
+            axis=2,
+        )
+    else:
+        rubber = material(mat.models.neo_hooke, C10=C10)
 
     # anisotropic hyperelastic material formulations for the fiber families
-    fiber1 = mat.MaterialHyperelasticPlaneStressIncompressible(
+    fiber1 = material(
         mat.models.fiber,
         E=fiber_modulus * factor,
         angle=fiber_axis - fiber_angle,
         axis=2,
         k=strain_exponent,
     )
-    fiber2 = mat.MaterialHyperelasticPlaneStressIncompressible(
+    fiber2 = material(
         mat.models.fiber,
         E=fiber_modulus * factor,
         angle=fiber_axis + fiber_angle,
@@ -61,3 +102,133 @@ def fiber_reinforced_rubber(
     )
 
     return rubber, fiber1, fiber2, vector1, vector2
+
+
+class FiberReinforcedRubberBatch:
+    """A batched (analytic) material formulation of the fiber-reinforced rubber
+    composite for arrays of material parameters, i.e. for many variants at once.
+
+    The parameters are broadcasted to a common shape ``(nvariants,)``. The stresses
+    and the elasticity tensors of all variants are evaluated in one pass for a
+    shared (plane stress, incompressible) deformation gradient ``F`` of shape
+    ``(2, 2, ...)``, with an additional trailing batch axis of the variants. The
+    results are identical to the (fused) material formulation of
+    ``fiber_reinforced_rubber()``.
+    """
+
+    def __init__(
+        self,
+        C10=0.5,
+        fiber_angle=15,
+        fiber_modulus=3600,
+        fiber_area=0.08,
+        thickness=5,
+        strain_exponent=0,
+        axis=1,
+        fiber_distance=1,
+    ):
+        C10, fiber_angle, fiber_modulus, fiber_area, thickness, k, fiber_distance = (
+            np.broadcast_arrays(
+                *[
+                    np.atleast_1d(np.asarray(p, dtype=float))
+                    for p in [
+                        C10,
+                        fiber_angle,
+                        fiber_modulus,
+                        fiber_area,
+                        thickness,
+                        strain_exponent,
+                        fiber_distance,
+                    ]
+                ]
+            )
+        )
+
+        fiber_axis = {0: 0, 1: 90}[axis]
+
+        # effective elastic modulus per thickness - correction factor
+        a = np.deg2rad(fiber_angle)
+        factor = fiber_area / (fiber_distance / np.cos(a)) / thickness
+
+        self.nvariants = len(C10)
+        self.C10 = C10
+        self.E = fiber_modulus * factor
+        self.k = k
+
+        # fiber normal vectors (undeformed configuration) of shape (2, nvariants)
+        self.vectors = [
+            np.array([np.cos(angle), np.sin(angle)])
+            for angle in np.deg2rad(
+                [fiber_axis - fiber_angle, fiber_axis + fiber_angle]
+            )
+        ]
+
+    def _fibers(self, F):
+        "Stretches, fiber directions (current configuration) and strain functions."
+
+        for N in self.vectors:
+            N = N.reshape(2, *np.ones(F.ndim - 3, dtype=int), -1)
+            FN = np.einsum("iJ...,J...->i...", F, N)
+            stretch = np.sqrt(np.einsum("i...,i...->...", FN, FN))
+
+            # strain and its first and second derivative w.r.t. the stretch
+            k = self.k
+            with np.errstate(divide="ignore", invalid="ignore"):
+                strain = np.where(k == 0, np.log(stretch), (stretch**k - 1) / k)
+            dstrain = stretch ** (k - 1)
+            d2strain = (k - 1) * stretch ** (k - 2)
+
+            # no contribution of fibers in compression
+            active = strain > 0
+            strain, dstrain, d2strain = [
+                np.where(active, value, 0) for value in [strain, dstrain, d2strain]
+            ]
+
+            yield N, FN, stretch, strain, dstrain, d2strain
+
+    def gradient(self, x):
+        """Return the first Piola-Kirchhoff stress tensors of shape
+        ``(2, 2, ..., nvariants)`` (and no state variables)."""
+
+        F = x[0][..., None]
+        J = F[0, 0] * F[1, 1] - F[0, 1] * F[1, 0]
+        G = np.array([[F[1, 1], -F[1, 0]], [-F[0, 1], F[0, 0]]]) / J
+
+        # rubber: W = C10 (tr(F^T F) + 1 / J^2 - 3) with G = F^(-T)
+        P = 2 * self.C10 * (F - G / J**2)
+
+        # fibers: W = E strain(stretch)^2 / 2 with the stretch |F N|
+        for N, FN, stretch, strain, dstrain, d2strain in self._fibers(F):
+            phi = self.E * strain * dstrain / stretch
+            P = P + phi * np.einsum("i...,J...->iJ...", FN, N)
+
+        return [P, None]
+
+    def hessian(self, x):
+        """Return the fourth-order elasticity tensors of shape
+        ``(2, 2, 2, 2, ..., nvariants)``."""
+
+        F = x[0][..., None]
+        J = F[0, 0] * F[1, 1] - F[0, 1] * F[1, 0]
+        G = np.array([[F[1, 1], -F[1, 0]], [-F[0, 1], F[0, 0]]]) / J
+        ones = np.ones(np.broadcast_shapes(J.shape, self.C10.shape))
+        eye = np.eye(2)
+
+        # rubber: d(F^(-T) / J^2)/dF = - (2 F^(-T) x F^(-T) + F^(-T) o F^(-T)) / J^2
+        GG = 2 * np.einsum("iJ...,kL...->iJkL...", G, G) + np.einsum(
+            "iL...,kJ...->iJkL...", G, G
+        )
+        A = 2 * self.C10 * (np.einsum("ik,JL,...->iJkL...", eye, eye, ones) + GG / J**2)
+
+        # fibers: P = phi(stretch) F N x N
+        for N, FN, stretch, strain, dstrain, d2strain in self._fibers(F):
+            phi = self.E * strain * dstrain / stretch
+            dphi = (
+                self.E * (dstrain**2 + strain * d2strain) / stretch - phi / stretch
+            ) / stretch
+            A = A + phi * np.einsum("ik,J...,L...->iJkL...", eye, N * ones, N * ones)
+            A = A + dphi * np.einsum(
+                "i...,J...,k...,L...->iJkL...", FN, N * ones, FN, N * ones
+            )
+
+        return [A]
@@ -0,0 +1,214 @@
+import csv
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+import felupe as fem
+
+
+class Profiler(fem.Plugin):
+    """An opt-in profiler which records the wall time, the number of calls and the
+    peak (traced) memory allocation of named phases per substep and per Newton
+    iteration.
+
+    The material evaluations (``"material"``) and the assembly (``"assembly"``) of
+    solid bodies are instrumented by :meth:`instrument`, the linear solver
+    (``"solve"``) by :meth:`solver`. Other phases, e.g. the postprocessing, are
+    recorded by the context manager :meth:`phase` or by wrapped functions, see
+    :meth:`wrap`. The times of nested phases are exclusive, i.e. the time of the
+    assembly does not include the time of the material evaluation.
+
+    Each call of the linear solver completes a Newton iteration. The profiler is
+    used as plugin of a job, which completes a substep, or a substep is completed
+    in an existing plugin, i.e. ``profiler.complete()``. The peak memory allocation
+    is only recorded if ``memory=True`` (based on ``tracemalloc``).
+    """
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.records = {}
+        self.substep = 0
+        self.iteration = 0
+
+        self._stack = []
+        self._originals = []
+        self._tracing = False
+
+    def complete(self):
+        "Complete a substep."
+
+        self.substep += 1
+        self.iteration = 0
+
+    def after_substep(self, context, state):
+        "Complete a substep."
+        self.complete()
+
+    @contextmanager
+    def phase(self, name):
+        "A context manager to record the time and the memory of a named phase."
+
+        frame = {"children": 0.0, "current": 0, "peak": 0}
+
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+
+            current, peak = tracemalloc.get_traced_memory()
+            frame["current"] = frame["peak"] = current
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], peak)
+
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+        self._stack.append(frame)
+        key = (self.substep, self.iteration, name)
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            duration = time.perf_counter() - start
+            self._stack.pop()
+
+            peak = 0
+            if self.memory:
+                frame["peak"] = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                peak = frame["peak"] - frame["current"]
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent["children"] += duration
+                parent["peak"] = max(parent["peak"], frame["peak"])
+
+            record = self.records.setdefault(key, [0.0, 0, 0])
+            record[0] += duration - frame["children"]
+            record[1] += 1
+            record[2] = max(record[2], peak)
+
+            # stop the tracing of the memory after the outermost phase
+            if self._tracing and not self._stack:
+                tracemalloc.stop()
+                self._tracing = False
+
+    def wrap(self, fun, name):
+        "Return a function which records a named phase for each call of ``fun``."
+
+        @wraps(fun)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return fun(*args, **kwargs)
+
+        return wrapper
+
+    def solver(self, solver=None):
+        """Return a linear solver (default ``pypardiso.spsolve``) which records the
+        phase ``"solve"`` and completes a Newton iteration for each call."""
+
+        if solver is None:
+            from pypardiso import spsolve as solver
+
+        solve = self.wrap(solver, "solve")
+
+        @wraps(solver)
+        def wrapper(*args, **kwargs):
+            try:
+                return solve(*args, **kwargs)
+            finally:
+                self.iteration += 1
+
+        return wrapper
+
+    def _replace(self, obj, attr, name):
+        "Replace a method of an object by a wrapped method (restored on release)."
+
+        self._originals.append((obj, attr, obj.__dict__.get(attr)))
+        setattr(obj, attr, self.wrap(getattr(obj, attr), name))
+
+    def instrument(self, *solids):
+        """Instrument the material evaluations (``"material"``) and the assembly
+        (``"assembly"``) of solid bodies. Return the profiler, i.e. it may be used as
+        context manager which releases the instrumented methods on exit."""
+
+        for solid in solids:
+            self._replace(solid.umat, "gradient", "material")
+            self._replace(solid.umat, "hessian", "material")
+            self._replace(solid.assemble, "vector", "assembly")
+            self._replace(solid.assemble, "matrix", "assembly")
+
+        return self
+
+    def release(self):
+        "Restore all instrumented methods."
+
+        for obj, attr, original in reversed(self._originals):
+            if original is None:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, original)
+
+        self._originals.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def table(self):
+        """Return the records as a list of dicts with the substep, the Newton
+        iteration, the phase, the wall time (in s), the number of calls and the peak
+        memory allocation (in bytes)."""
+
+        return [
+            {
+                "substep": substep,
+                "iteration": iteration,
+                "phase": phase,
+                "time": duration,
+                "calls": calls,
+                "peak_memory": peak,
+            }
+            for (substep, iteration, phase), (duration, calls, peak) in (
+                self.records.items()
+            )
+        ]
+
+    def summary(self):
+        "Return the total time, calls and the max. peak memory allocation per phase."
+
+        summary = {}
+
+        for row in self.table():
+            item = summary.setdefault(
+                row["phase"],
+                {"phase": row["phase"], "time": 0.0, "calls": 0, "peak_memory": 0},
+            )
+            item["time"] += row["time"]
+            item["calls"] += row["calls"]
+            item["peak_memory"] = max(item["peak_memory"], row["peak_memory"])
+
+        return list(summary.values())
+
+    def to_json(self, filename):
+        "Export the records to a JSON-file."
+
+        with open(filename, "w") as file:
+            json.dump(self.table(), file, indent=2)
+
+    def to_csv(self, filename):
+        "Export the records to a CSV-file."
+
+        fieldnames = ["substep", "iteration", "phase", "time", "calls", "peak_memory"]
+
+        with open(filename, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(self.table())
@@ -0,0 +1,157 @@
+import json
+
+import felupe as fem
+import h5py
+import numpy as np
+
+from ._helpers import fiber_force
+
+
+class ResultsWriter(fem.Plugin):
+    """A streaming writer of the fields of a job to chunked and compressed datasets of
+    a HDF5-file, to be used as plugin of a job, i.e. ``fem.Job(steps,
+    plugins=[ResultsWriter(filename, solid, thickness, fiber_area, vectors)])``.
+
+    After each substep, the displacements, the (first Piola-Kirchhoff) stresses of the
+    solid body and the fiber forces per undeformed (fiber) area of each fiber family
+    at the points of the mesh, see ``fiber_force()``, and the reaction forces on the
+    ``boundaries`` (a dict) are appended to resizable datasets with one substep per
+    chunk. The points and cells of the mesh and the parameter set (as attributes)
+    are written once. All datasets are stored in a ``group`` of the file, e.g. one
+    group per load case, and an existing group is replaced.
+
+    The datasets are ``displacement``, ``stress``, ``fiber_force_1``,
+    ``fiber_force_2``, ``reaction_force/<boundary>``, ``step`` and ``substep``, with
+    the substeps along the first axis. Slices of a dataset are read without loading
+    the whole run, see ``read_results()``.
+    """
+
+    def __init__(
+        self,
+        filename,
+        solid,
+        thickness,
+        fiber_area,
+        vectors,
+        projector=None,
+        umats=None,
+        boundaries=None,
+        parameters=None,
+        group="/",
+        mode="w",
+        compression="gzip",
+    ):
+        self.solid = solid
+        self.thickness = thickness
+        self.fiber_area = fiber_area
+        self.vectors = vectors
+        self.projector = projector
+        self.umats = umats
+        self.boundaries = boundaries
+        self.compression = compression
+        self.nsubsteps = 0
+
+        if self.umats is None:
+            self.umats = [None] * len(self.vectors)
+
+        if self.boundaries is None:
+            self.boundaries = {}
+
+        if parameters is None:
+            parameters = {}
+
+        self.file = h5py.File(filename, mode)
+
+        if group != "/" and group in self.file:
+            del self.file[group]
+
+        self.group = self.file.require_group(group)
+
+        # the parameter set as attributes (and as JSON for non-scalar values)
+        self.group.attrs["parameters"] = json.dumps(parameters, default=str)
+        for key, value in parameters.items():
+            if isinstance(value, (bool, int, float, str)):
+                self.group.attrs[key] = value
+
+        mesh = self.solid.field.region.mesh
+        self.group.create_dataset("points", data=mesh.points)
+        self.group.create_dataset("cells", data=mesh.cells)
+        self.group.attrs["cell_type"] = mesh.cell_type
+
+    def _append(self, name, value):
+        "Append the values of a substep to a (new) resizable dataset."
+
+        value = np.asarray(value)
+
+        if name not in self.group:
+            self.group.create_dataset(
+                name,
+                shape=(0, *value.shape),
+                maxshape=(None, *value.shape),
+                chunks=(1, *value.shape),
+                dtype=value.dtype,
+                compression=self.compression,
+                shuffle=self.compression is not None,
+            )
+
+        dataset = self.group[name]
+        dataset.resize(self.nsubsteps + 1, axis=0)
+        dataset[self.nsubsteps] = value
+
+    def write(self, i, j, substep):
+        "Evaluate the fields of the substep and append them to the datasets."
+
+        field = substep.x
+        stress = self.solid.results.stress[0]
+
+        if self.projector is None:
+            stress = fem.project(stress, self.solid.field.region)
+        else:
+            stress = self.projector(stress)
+
+        self._append("step", i)
+        self._append("substep", j)
+        self._append("displacement", field[0].values)
+        self._append("stress", stress)
+
+        for k, (vector, umat) in enumerate(zip(self.vectors, self.umats)):
+            force = fiber_force(
+                self.solid,
+                self.thickness,
+                self.fiber_area,
+                vector,
+                self.projector,
+                umat,
+            )
+            self._append(f"fiber_force_{k + 1}", force)
+
+        for label, boundary in self.boundaries.items():
+            force = fem.tools.force(field, substep.fun, boundary)
+            self._append(f"reaction_force/{label}", force)
+
+        self.nsubsteps += 1
+        self.file.flush()
+
+    def after_substep(self, context, state):
+        "Append the fields after a completed substep."
+        self.write(state.stepnumber, state.substepnumber, context.substep)
+
+    def close(self):
+        "Close the HDF5-file."
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_results(filename):
+    """Open a HDF5-file of a ``ResultsWriter`` in read-only mode. The datasets are
+    read on slicing, i.e. ``read_results(filename)["fiber_force_1"][:, 0]`` reads
+    only the first point of the first fiber family for all substeps. The parameter
+    set of a group is given by ``json.loads(file[group].attrs["parameters"])``.
+    """
+
+    return h5py.File(filename, "r")
@@ -2,8 +2,80 @@ import felupe as fem
 import numpy as np
 
 
-def rubber(width=50, height=50, middle=5, radius=20, angle=120):
-    "Create a 2d-quad mesh for the test specimen."
+def graded(n, bias=1):
+    """Return ``n`` normalized coordinates in the interval ``[0, 1]`` with a geometric
+    grading, i.e. a ratio ``bias`` of the size of the last to the first cell."""
+
+    if bias == 1 or n < 3:
+        return np.linspace(0, 1, n)
+
+    sizes = bias ** (np.arange(n - 1) / (n - 2))
+    return np.concatenate([[0], np.cumsum(sizes)]) / sizes.sum()
+
+
+def grade(points, length, n, bias=1):
+    "Map uniformly spaced coordinates in ``[0, length]`` to graded coordinates."
+
+    if bias == 1:
+        return points
+
+    return length * np.interp(points / length, np.linspace(0, 1, n), graded(n, bias))
+
+
+# reversed orientation of (linear, serendipity and Lagrange) quad cells
+flipped = np.array([3, 2, 1, 0, 6, 5, 4, 7, 8])
+
+
+def mirror(mesh, axis=0):
+    "Mirror a quad mesh at a coordinate axis and reverse the orientation of the cells."
+
+    points = mesh.points.copy()
+    points[:, axis] *= -1
+    cells = mesh.cells[:, flipped[: mesh.cells.shape[1]]]
+
+    return fem.Mesh(points, cells, cell_type=mesh.cell_type)
+
+
+def rubber(
+    width=50,
+    height=50,
+    middle=5,
+    radius=20,
+    angle=120,
+    size=None,
+    size_middle=None,
+    size_radius=None,
+    size_tangential=None,
+    bias=1,
+    bias_radius=1,
+    bias_tangential=1,
+    cell_type="quad",
+    half=False,
+):
+    """Create a 2d-quad mesh for the test specimen.
+
+    By default, the number of cells is given by the dimensions of the blocks (with
+    approximately 1 mm cells). Optionally, the mean cell size (in mm) is given by
+    ``size`` in x-direction and in y-direction per block for the middle strip
+    (``size_middle``), the block with the notch radius (``size_radius``) and the
+    block with the tangential continuation (``size_tangential``), which all default
+    to ``size`` (or to the default number of cells of a block). The cells are graded
+    by the ratios of the largest to the smallest cell size per direction, i.e.
+    ``bias`` refines the cells in x-direction towards the notch, ``bias_radius``
+    refines the cells of the radius block towards the middle strip and
+    ``bias_tangential`` refines the cells of the tangential block towards the radius
+    block.
+
+    The cell type is either a linear ``"quad"``, a quadratic serendipity ``"quad8"``
+    or a quadratic Lagrange ``"quad9"`` cell. The midpoints of quadratic cells are
+    located on the notch radius.
+
+    If ``half=True``, only the upper half (``Y >= 0``) of the point-symmetric test
+    specimen is returned, see :class:`PointSymmetry`.
+    """
+
+    if cell_type not in ["quad", "quad8", "quad9"]:
+        raise TypeError(f"Cell type {cell_type} is not supported.")
 
     # parameters
     w = width
@@ -23,19 +95,54 @@ def rubber(width=50, height=50, middle=5, radius=20, angle=120):
     # top right, middle part (radius)
     L1 = w / 2 + R * (1 - np.cos(alpha))
     H1 = R * np.sin(alpha)
-    mesh1 = fem.Rectangle(b=(L1, H1), n=(int(L1), int(H1)))
+
+    # top right, upper part (tangential continuation)
+    L2 = L1
+    H2 = H / 2 - H1 - H3
+
+    def points(length, size):
+        "Number of points for a given length and mean cell size."
+        return max(int(np.ceil(length / size - 1e-8)) + 1, 2)
+
+    # number of points per block and direction (default: approx. 1 mm cells), the
+    # sizes per block override the default or the mean cell size
+    nx, n1, n2, n3 = int(L1), int(H1), int(H2), 2 * int(H3)
+
+    if size is not None:
+        nx = points(L1, size)
+    if (size_radius or size) is not None:
+        n1 = points(H1, size_radius or size)
+    if (size_tangential or size) is not None:
+        n2 = points(H2, size_tangential or size)
+    if (size_middle or size) is not None:
+        n3 = points(H3, size_middle or size)
+
+    # refine the cells towards the notch (the same grading in x for all blocks)
+    def rectangle(length, height, ny, bias_y):
+        "A rectangle with graded points in x- and y-direction."
+        mesh = fem.Rectangle(b=(length, height), n=(nx, ny))
+        mesh.points[:, 0] = grade(mesh.points[:, 0], length, nx, 1 / bias)
+        mesh.points[:, 1] = grade(mesh.points[:, 1], height, ny, bias_y)
+
+        # add the midpoints of quadratic cells (before the mapping to the radius)
+        if cell_type in ["quad8", "quad9"]:
+            mesh = mesh.add_midpoints_edges()
+        if cell_type == "quad9":
+            mesh = mesh.add_midpoints_faces()
+
+        return mesh
+
+    mesh1 = rectangle(L1, H1, n1, bias_radius)
     Y1 = mesh1.points[:, 1]
     fx1 = 1 + R * np.cos(alpha) / L1 - np.sqrt(R**2 - Y1**2) / L1
     mesh1.points[:, 0] *= fx1
     mesh1.points[:, 1] += H3
 
     # top right, lower part (rectangle)
-    mesh3 = fem.Rectangle(b=(L3, H3), n=(int(L1), 2 * int(H3)))
+    mesh3 = rectangle(L3, H3, n3, 1)
 
     # top right, upper part (tangential continuation)
-    L2 = L1
-    H2 = H / 2 - H1 - H3
-    mesh2 = fem.Rectangle(b=(L2, H2), n=(int(L2), int(H2)))
+    mesh2 = rectangle(L2, H2, n2, bias_tangential)
     Y2 = mesh2.points[:, 1]
     fx2 = 1 + np.tan(alpha) * Y2 / L2
     mesh2.points[:, 0] *= fx2
@@ -55,25 +162,30 @@ def rubber(width=50, height=50, middle=5, radius=20, angle=120):
     )
 
     # top left
-    mesh21 = fem.mesh.mirror(mesh12)
+    mesh21 = mirror(mesh12, axis=0)
     mesh1221 = fem.Mesh(
         points=np.vstack((mesh12.points, mesh21.points)),
         cells=np.vstack((mesh12.cells, mesh21.cells + mesh12.npoints)),
         cell_type=mesh12.cell_type,
     )
 
-    # bottom
-    mesh3443 = fem.mesh.mirror(mesh1221, normal=[0, 1])
-
-    # total mesh
-    mesh = fem.mesh.sweep(
-        fem.Mesh(
-            points=np.vstack((mesh1221.points, mesh3443.points)),
-            cells=np.vstack((mesh1221.cells, mesh3443.cells + mesh1221.npoints)),
-            cell_type=mesh1221.cell_type,
-        ),
-        decimals=3,
-    )
+    if half:
+        # upper half
+        mesh = fem.mesh.sweep(mesh1221, decimals=3)
+
+    else:
+        # bottom
+        mesh3443 = mirror(mesh1221, axis=1)
+
+        # total mesh
+        mesh = fem.mesh.sweep(
+            fem.Mesh(
+                points=np.vstack((mesh1221.points, mesh3443.points)),
+                cells=np.vstack((mesh1221.cells, mesh3443.cells + mesh1221.npoints)),
+                cell_type=mesh1221.cell_type,
+            ),
+            decimals=3,
+        )
 
     def limit(y):
         "Evaluate the maximum x-value for a given y-coordinate."
@@ -0,0 +1,297 @@
+from functools import partial
+
+import felupe as fem
+import numpy as np
+
+from ._helpers import Projector
+from ._materials import fiber_reinforced_rubber
+from ._results import ResultsWriter
+from ._rubber import rubber
+from ._solver import PardisoSolver
+from ._symmetry import PointSymmetry
+
+# regions for the cell types of the mesh
+regions = {
+    "quad": fem.RegionQuad,
+    "quad8": fem.RegionQuadraticQuad,
+    "quad9": fem.RegionBiQuadraticQuad,
+}
+
+
+def _model(
+    width=50,
+    height=50,
+    middle=5,
+    radius=20,
+    angle=120,
+    fiber_angle=15,
+    fiber_axis=1,
+    fiber_distance=1,
+    fiber_modulus=3600,
+    fiber_area=0.08,
+    strain_exponent=0,
+    C10=0.5,
+    thickness=5,
+    threads=None,
+    compiled=False,
+    kernel_cache=None,
+    size=None,
+    size_middle=None,
+    size_radius=None,
+    size_tangential=None,
+    bias=1,
+    bias_radius=1,
+    bias_tangential=1,
+    cell_type="quad",
+    half=False,
+):
+    """Create the field, the boundaries, the constraints and the solid body (with a
+    combined material formulation) of the test specimen. Returns also the materials
+    and the vectors of the fiber families, see ``fiber_reinforced_rubber()``."""
+
+    # create a numeric region and a displacement field
+    mesh, limit = rubber(
+        width,
+        height,
+        middle,
+        radius,
+        angle,
+        size=size,
+        size_middle=size_middle,
+        size_radius=size_radius,
+        size_tangential=size_tangential,
+        bias=bias,
+        bias_radius=bias_radius,
+        bias_tangential=bias_tangential,
+        cell_type=cell_type,
+        half=half,
+    )
+    region = regions[mesh.cell_type](mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=2)])
+
+    # setup boundary conditions
+    if half:
+        # moved top edge of the upper half, point-symmetry constraint on the cut line
+        top = mesh.points[:, 1].max()
+        bounds = {
+            "compression_top": fem.Boundary(field[0], fy=top, skip=(1, 0)),
+            "move": fem.Boundary(field[0], fy=top, skip=(0, 1)),
+        }
+        constraints = [PointSymmetry(field)]
+    else:
+        bounds, loadcase = fem.dof.shear(field)
+        constraints = []
+
+    # combined material formulation for the rubber and both fiber families
+    material, fibermat1, fibermat2, vector1, vector2 = fiber_reinforced_rubber(
+        C10=C10,
+        fiber_angle=fiber_angle,
+        fiber_modulus=fiber_modulus,
+        fiber_area=fiber_area,
+        thickness=thickness,
+        strain_exponent=strain_exponent,
+        axis=fiber_axis,
+        fiber_distance=fiber_distance,
+        fused=True,
+        compiled=compiled,
+        cache=kernel_cache,
+    )
+
+    # number of threads for the evaluation of the material formulation
+    if threads is not None:
+        material.gradient = partial(material.gradient, threads=threads)
+        material.hessian = partial(material.hessian, threads=threads)
+
+    solid = fem.SolidBody(material, field)
+
+    materials = (material, fibermat1, fibermat2, vector1, vector2)
+
+    return field, bounds, constraints, solid, materials
+
+
+def simulate_test_specimen(
+    width=50,
+    height=50,
+    middle=5,
+    radius=20,
+    angle=120,
+    fiber_angle=15,
+    fiber_axis=1,
+    fiber_distance=1,
+    fiber_modulus=3600,
+    fiber_area=0.08,
+    strain_exponent=0,
+    C10=0.5,
+    thickness=5,
+    tension_max=8,
+    lateral_max=23,
+    num=None,
+    solver=None,
+    tol=1e-2,
+    threads=None,
+    profiler=None,
+    compiled=False,
+    kernel_cache=None,
+    size=None,
+    size_middle=None,
+    size_radius=None,
+    size_tangential=None,
+    bias=1,
+    bias_radius=1,
+    bias_tangential=1,
+    cell_type="quad",
+    half=False,
+    continuation=None,
+    adaptive=None,
+    results=None,
+):
+    """Evaluate the force-displacement characteristic curves of the test specimen
+    under tension (``U=0``) and under tension and shear (``U=lateral_max``).
+
+    Returns a dict with the displacement ``V`` and the reaction forces ``F_Y`` (at
+    ``U=0`` and ``U=lateral_max``) and ``F_X`` (at ``U=lateral_max``) in N. The
+    number of threads used by the material formulation is bound by ``threads``.
+    Optionally, the phases of the simulation are recorded by a ``Profiler`` and the
+    material formulation is evaluated by compiled kernels (stored in a
+    ``KernelCache`` or a path given by ``kernel_cache``). The density of the mesh is
+    controlled by the mean cell sizes and the gradings of the cells and the cells are
+    either linear or quadratic (``cell_type``), see ``create_test_specimen()``. If
+    ``half=True``, only the upper half of the point-symmetric test specimen is solved
+    with a point-symmetry constraint on the cut line, see ``PointSymmetry``.
+
+    For scans of nearby parameter sets, a ``Continuation`` plugin warm-starts the
+    substeps of both load cases by the solutions of the previous call with the same
+    mesh, e.g. ``[simulate_test_specimen(fiber_angle=a, continuation=c) for a in
+    angles]``. The substeps are subdivided into adaptive increments by an optional
+    ``AdaptiveSteps`` plugin, i.e. the ``num`` substeps are only the output points.
+
+    Optionally, the fields of all substeps and the parameter set are written to the
+    groups ``tension`` and ``tensionshear`` of a HDF5-file ``results``, see
+    ``ResultsWriter``.
+    """
+
+    # the (scalar) parameters of the simulation
+    parameters = {
+        key: value
+        for key, value in locals().items()
+        if isinstance(value, (bool, int, float, str))
+    }
+
+    field, bounds, constraints, solid, materials = _model(
+        width=width,
+        height=height,
+        middle=middle,
+        radius=radius,
+        angle=angle,
+        fiber_angle=fiber_angle,
+        fiber_axis=fiber_axis,
+        fiber_distance=fiber_distance,
+        fiber_modulus=fiber_modulus,
+        fiber_area=fiber_area,
+        strain_exponent=strain_exponent,
+        C10=C10,
+        thickness=thickness,
+        threads=threads,
+        compiled=compiled,
+        kernel_cache=kernel_cache,
+        size=size,
+        size_middle=size_middle,
+        size_radius=size_radius,
+        size_tangential=size_tangential,
+        bias=bias,
+        bias_radius=bias_radius,
+        bias_tangential=bias_tangential,
+        cell_type=cell_type,
+        half=half,
+    )
+    material, fibermat1, fibermat2, vector1, vector2 = materials
+
+    # linear solver with a re-used symbolic factorization for both load cases
+    if solver is None:
+        solver = PardisoSolver()
+
+    # record the material evaluation, the assembly and the linear solver
+    plugins = []
+    if profiler is not None:
+        profiler.instrument(solid)
+        solver = profiler.solver(solver)
+        plugins.append(profiler)
+
+    # warm-start the substeps by the solutions of the previous parameter variant
+    if continuation is not None:
+        continuation.restart()
+        plugins.append(continuation)
+
+    # adaptive increments between the output points
+    if adaptive is not None:
+        plugins.append(adaptive)
+
+    # number of substeps (with a default step size of 1 mm)
+    if num is None:
+        num = int(np.ceil(tension_max))
+
+    if results is not None:
+        projector = Projector(field[0].region)
+
+    curves = []
+
+    try:
+        for label, lateral in zip(["tension", "tensionshear"], [0, lateral_max]):
+            # write the fields of the substeps to a group of the results file
+            writers = []
+            if results is not None:
+                writers.append(
+                    ResultsWriter(
+                        results,
+                        solid,
+                        thickness,
+                        fiber_area,
+                        vectors=[vector1, vector2],
+                        projector=projector,
+                        umats=[fibermat1, fibermat2],
+                        boundaries=bounds,
+                        parameters=parameters,
+                        group=label,
+                        mode="w" if label == "tension" else "a",
+                    )
+                )
+
+            step = fem.Step(
+                items=[solid, *constraints],
+                boundaries=bounds,
+                ramp={
+                    bounds["compression_top"]: fem.math.linsteps(
+                        [0, tension_max], num=num
+                    ),
+                    bounds["move"]: fem.math.linsteps([lateral, lateral], num=num),
+                },
+            )
+            curve = fem.CharacteristicCurve(
+                steps=[step],
+                boundary=bounds["move"],
+                plugins=[*plugins, *writers],
+            )
+
+            try:
+                curve.evaluate(solver=solver, tol=tol, verbose=False)
+            finally:
+                for writer in writers:
+                    writer.close()
+
+            curves.append(curve)
+
+    finally:
+        # release the instrumented methods (also after a failed evaluation)
+        if profiler is not None:
+            profiler.release()
+
+    tension, tensionshear = [
+        (np.array(curve.x)[:, 1], np.array(curve.y) * thickness) for curve in curves
+    ]
+
+    return {
+        "displacement": tension[0],
+        "force_tension": tension[1][:, 1],
+        "force_tensionshear": tensionshear[1][:, 1],
+        "force_lateral": tensionshear[1][:, 0],
+    }
@@ -0,0 +1,71 @@
+import numpy as np
+from pypardiso import PyPardisoSolver, spsolve
+
+# the private methods of pypardiso to call the phases of Pardiso
+_private = ["_check_A", "_check_b", "_call_pardiso"]
+
+
+class PardisoSolver:
+    """A linear solver based on Pardiso (MKL) for the stiffness matrices of specimen
+    jobs with a fixed sparsity pattern, e.g. ``job.evaluate(solver=PardisoSolver())``.
+
+    The reordering and symbolic factorization (phase 11) is performed only once per
+    sparsity pattern of the matrix. All other calls perform only the numeric
+    factorization and the solve (phase 23). The solver is reused across all steps
+    and jobs with the same boundary conditions. Note that several instances of the
+    solver should not be used in parallel threads of the same process.
+
+    The phases are called by private methods of ``pypardiso.PyPardisoSolver``
+    (tested with pypardiso 0.4). If they are not available, every call falls back to
+    ``pypardiso.spsolve``, i.e. without the re-use of the symbolic factorization.
+    """
+
+    def __init__(self, mtype=11):
+        self.solver = PyPardisoSolver(mtype=mtype)
+        self.indptr = None
+        self.indices = None
+        self.nanalysis = 0
+
+    def _is_same_pattern(self, A):
+        "Check if the sparsity pattern of a matrix is the same as the analysed one."
+
+        return (
+            self.indptr is not None
+            and np.array_equal(A.indptr, self.indptr)
+            and np.array_equal(A.indices, self.indices)
+        )
+
+    def __call__(self, A, b):
+        "Solve the linear equation system ``A x = b``."
+
+        A = A.tocsr()
+
+        if not all(hasattr(self.solver, name) for name in _private):
+            return spsolve(A, b)
+
+        self.solver._check_A(A)
+        b = self.solver._check_b(A, b)
+
+        # reordering and symbolic factorization (once per sparsity pattern)
+        if not self._is_same_pattern(A):
+            self.solver.set_phase(11)
+            self.solver._call_pardiso(A, np.zeros((A.shape[0], 1)))
+            self.indptr = A.indptr.copy()
+            self.indices = A.indices.copy()
+            self.nanalysis += 1
+
+        # numeric factorization and solve
+        self.solver.set_phase(23)
+        x = self.solver._call_pardiso(A, b)
+
+        # re-analyse the matrix after a failed (non-finite) factorization
+        if not np.all(np.isfinite(x)):
+            self.free()
+
+        return x.squeeze()
+
+    def free(self):
+        "Release the internal memory of Pardiso."
+
+        self.solver.free_memory(everything=True)
+        self.indptr = self.indices = None
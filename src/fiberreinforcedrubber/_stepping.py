@@ -0,0 +1,190 @@
+import felupe as fem
+import numpy as np
+
+
+class AdaptiveSteps(fem.CutbackPlugin):
+    """An adaptive load-step control for specimen jobs, e.g.
+    ``fem.Job(steps, plugins=[AdaptiveSteps()])``.
+
+    The substeps of the ramp are the output points of the job, e.g. ``V = 6, 7, 8``
+    mm. Each substep is subdivided into increments of the ramped values with an
+    adaptive size. After a fast converged increment (with at most ``fast``
+    Newton-Raphson iterations), the next increment is increased by the factor
+    ``growth``. After a failed increment, the checkpoint of the last converged
+    increment is restored and the increment is reduced by the factor ``factor``.
+    The size of the increment is kept across the substeps (as the max. absolute
+    change of the ramped values) and the last increment of a substep always hits
+    the values of the substep exactly.
+
+    With the default ``increment=None``, the first increment is the whole substep.
+    The smallest increment of a substep is ``factor**max_cutbacks`` of the substep.
+    Only the output points are handed back to the step, i.e. the other plugins and the
+    characteristic curves of a job contain only the substeps of the ramp.
+
+    The hooks replace those of ``fem.CutbackPlugin``. If the smallest increment is
+    exhausted before the last increment, the state of the previous output point is
+    restored and the substep is left to the step. If it fails, the error of the
+    increments is raised by the step after ``after_failed_substep`` of all plugins.
+    """
+
+    def __init__(
+        self,
+        increment=None,
+        factor=0.5,
+        growth=2.0,
+        fast=3,
+        max_cutbacks=10,
+        exceptions=(fem.NewtonConvergenceError, ArithmeticError, np.linalg.LinAlgError),
+    ):
+        super().__init__(
+            factor=factor,
+            max_cutbacks=max_cutbacks,
+            growth=growth,
+            exceptions=exceptions,
+        )
+        self.increment = increment
+        self.fast = fast
+
+        # load factor of the last converged increment of the current substep
+        self._t = 1.0
+        self._distance = 0.0
+        self._start = None
+
+        # the checkpoint of the previous output point and the error of the increments
+        self._substep = None
+        self._error = None
+
+    def _grow(self, result, dt):
+        "Update the size of the next increment after a converged increment."
+
+        increment = dt * self._distance
+
+        if result.iterations is not None and result.iterations <= self.fast:
+            increment *= self.growth
+
+        self.increment = increment
+        self.load_factors[-1].append(self._t)
+
+    def _reset(self, context):
+        "Restore the unknowns, the items and the ramped values of the output point."
+
+        self.restore(context, self._substep)
+
+        for item, value in self._start.items():
+            item.update(value)
+
+    def _cutback(self, context, state, dt, error):
+        """Restore the last converged increment and reduce the failed increment (but
+        not below the smallest increment)."""
+
+        self.restore(context, self._checkpoint)
+        self.cutbacks[-1] += 1
+
+        if self.factor * dt < self.factor**self.max_cutbacks * (1 - 1e-9):
+            raise fem.NewtonConvergenceError(
+                f"Adaptive steps failed: substep {1 + state.substepnumber} "
+                f"was not recovered after {self.cutbacks[-1]} cutbacks."
+            ) from error
+
+        self.increment = self.factor * dt * self._distance
+
+    def _solve(self, context, state, final):
+        """Solve the increments of the current substep. The last increment is only
+        solved if ``final=True``, otherwise it is left to the step."""
+
+        while True:
+            dt = 1.0 - self._t
+            if self.increment is not None:
+                dt = min(self.increment / self._distance, dt)
+
+            last = self._t + dt > 1.0 - 1e-12
+
+            if last and not final:
+                return None
+
+            values = state.values
+            if not last:
+                values = {
+                    item: start + (self._t + dt) * (state.values[item] - start)
+                    for item, start in self._start.items()
+                }
+
+            try:
+                result = context.solve(values)
+
+            except self.exceptions as error:
+                self._cutback(context, state, dt, error)
+                continue
+
+            self._t = 1.0 if last else self._t + dt
+            self._grow(result, dt)
+            self._checkpoint = self.checkpoint(context)
+
+            if last:
+                return result
+
+    def before_substep(self, context, state):
+        "Solve the increments of the substep, except the last one."
+
+        self._substep = self._checkpoint = self.checkpoint(context)
+        self.load_factors.append([])
+        self.cutbacks.append(0)
+        self._t = 1.0
+        self._error = None
+
+        # the current values of the ramped items (e.g. of the boundaries)
+        start = {item: getattr(item, "value", None) for item in state.values}
+
+        if len(start) == 0 or any(value is None for value in start.values()):
+            return
+
+        self._start = {
+            item: np.array(value, dtype=float) for item, value in start.items()
+        }
+        self._distance = max(
+            np.max(abs(np.asarray(state.values[item]) - value), initial=0.0)
+            for item, value in self._start.items()
+        )
+
+        if self._distance > 0:
+            self._t = 0.0
+
+            try:
+                self._solve(context, state, final=False)
+
+            except fem.NewtonConvergenceError as error:
+                # restore the previous output point and leave the substep to the step
+                self._reset(context)
+                self._checkpoint = self._substep
+                self._t = 0.0
+                self._error = error
+
+    def after_substep(self, context, state):
+        "Update the size of the next increment after the last increment."
+
+        if self._t < 1.0:
+            self._t, dt = 1.0, 1.0 - self._t
+            self._grow(state.result, dt)
+
+    def after_failed_substep(self, context, state):
+        "Reduce the increment and solve the remaining increments of the substep."
+
+        if state.result is not None or not isinstance(state.error, self.exceptions):
+            return
+
+        # the smallest increment was already exhausted before the last increment
+        if self._error is not None:
+            self._reset(context)
+            state.error = self._error
+            return
+
+        if self._t >= 1.0:
+            return
+
+        try:
+            self._cutback(context, state, 1.0 - self._t, state.error)
+            state.result = self._solve(context, state, final=True)
+            state.error = None
+        except fem.NewtonConvergenceError as error:
+            self._reset(context)
+            state.error = error
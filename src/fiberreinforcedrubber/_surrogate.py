@@ -0,0 +1,242 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.optimize import minimize
+from scipy.stats import qmc
+
+from ._sweep import sweep
+
+
+def _correlation(x, y, length_scales):
+    "Squared-exponential correlation with a length scale per parameter."
+
+    distance = (x[:, None, :] - y[None, :, :]) / length_scales
+    return np.exp(-0.5 * np.sum(distance**2, axis=-1))
+
+
+class Surrogate:
+    """A surrogate model of the force-displacement curves of the test specimen over a
+    box of parameters, e.g. ``Surrogate({"fiber_angle": (10, 30), "radius": (15,
+    25)}, tension_max=8)``.
+
+    A Gaussian process with a squared-exponential correlation (one length scale per
+    parameter) and a small nugget is fitted to the (standardized) curves of a
+    columnar results store of ``sweep()``. The length scales and the nugget are found
+    by maximizing the marginal likelihood, all points of all curves share one
+    correlation and the variances are estimated per point of the curves. The sample
+    design is a latin hypercube, see :meth:`design`, and :meth:`train` evaluates and
+    fits the design in one call.
+
+    The predicted curves are returned along with their standard deviations.
+    Parameter sets outside of the box are flagged and, if ``fallback=True``, they
+    are evaluated by the function of the simulation (default
+    ``simulate_test_specimen``) with the fixed keyword arguments.
+    """
+
+    def __init__(
+        self,
+        bounds,
+        outputs=("force_tension", "force_tensionshear", "force_lateral"),
+        fun=None,
+        **kwargs,
+    ):
+        self.bounds = bounds
+        self.names = list(bounds.keys())
+        self.lower, self.upper = np.array(list(bounds.values()), dtype=float).T
+        self.outputs = list(outputs)
+        self.fun = fun
+        self.kwargs = kwargs
+
+        self.length_scales = None
+        self.nugget = None
+
+    def _scale(self, x):
+        "Scale parameters to the unit box."
+        return (x - self.lower) / (self.upper - self.lower)
+
+    def design(self, n, seed=None):
+        "A latin hypercube sample design (list of parameter sets) of the box."
+
+        sample = qmc.LatinHypercube(d=len(self.names), seed=seed).random(n)
+        sample = qmc.scale(sample, self.lower, self.upper)
+
+        return [dict(zip(self.names, x.tolist())) for x in sample]
+
+    def train(self, n, seed=None, processes=None, threads=1):
+        "Evaluate a latin hypercube sample design by ``sweep()`` and fit the model."
+
+        store = sweep(
+            self.design(n, seed=seed),
+            fun=self.fun,
+            processes=processes,
+            threads=threads,
+            **self.kwargs,
+        )
+
+        return self.fit(store)
+
+    def _likelihood(self, theta, x, y):
+        "The negative log marginal likelihood (with profiled variances)."
+
+        length_scales, nugget = np.exp(theta[:-1]), np.exp(theta[-1])
+        n = len(x)
+        R = _correlation(x, x, length_scales) + nugget * np.eye(n)
+
+        try:
+            factor = cho_factor(R, lower=True)
+        except np.linalg.LinAlgError:
+            return np.inf
+
+        variances = np.sum(y * cho_solve(factor, y), axis=0) / n
+        logdet = 2 * np.sum(np.log(np.diag(factor[0])))
+
+        return 0.5 * np.sum(n * np.log(np.fmax(variances, 1e-300)) + logdet)
+
+    def fit(self, store):
+        """Fit the model to the successful parameter sets of a columnar results store
+        of ``sweep()``."""
+
+        success = store["success"]
+        x = self._scale(np.array([store[name][success] for name in self.names]).T)
+
+        # the points of all curves (the columns with NaN are dropped)
+        curves = [store[key][success] for key in self.outputs]
+        self._shapes = [curve.shape[1:] for curve in curves]
+        y = np.hstack([curve.reshape(len(x), -1) for curve in curves])
+        self._finite = np.all(np.isfinite(y), axis=0)
+        y = y[:, self._finite]
+
+        self.displacement = None
+        if "displacement" in store:
+            self.displacement = store["displacement"][success][0]
+
+        # standardized curves
+        self._mean = y.mean(axis=0)
+        self._std = y.std(axis=0)
+        self._std[self._std == 0] = 1
+        y = (y - self._mean) / self._std
+
+        # length scales and nugget by maximizing the marginal likelihood
+        d = x.shape[1]
+        starts = [np.log(0.5), np.log(0.2), np.log(1.0)]
+        bounds = [(np.log(0.02), np.log(20))] * d + [(np.log(1e-10), np.log(1e-1))]
+        results = [
+            minimize(
+                self._likelihood,
+                np.append(np.full(d, start), np.log(1e-6)),
+                args=(x, y),
+                method="L-BFGS-B",
+                bounds=bounds,
+            )
+            for start in starts
+        ]
+        theta = min(results, key=lambda result: result.fun).x
+
+        self.length_scales, self.nugget = np.exp(theta[:-1]), np.exp(theta[-1])
+
+        R = _correlation(x, x, self.length_scales) + self.nugget * np.eye(len(x))
+        self._L = np.linalg.cholesky(R)
+        self._alpha = cho_solve((self._L, True), y)
+        self._variances = np.sum(y * self._alpha, axis=0) / len(x)
+        self._x = x
+
+        return self
+
+    def _unpack(self, y):
+        "Split the flat (standardized) points of the curves to the outputs."
+
+        values = np.full((len(y), self._finite.size), np.nan)
+        values[:, self._finite] = y
+
+        result = {}
+        start = 0
+        for key, shape in zip(self.outputs, self._shapes):
+            size = int(np.prod(shape))
+            result[key] = values[:, start : start + size].reshape(-1, *shape)
+            start += size
+
+        return result
+
+    def _points(self, parameters):
+        "The (broadcasted) parameter sets and their scaled points in the unit box."
+
+        values = [np.atleast_1d(parameters[name]) for name in self.names]
+        values = np.broadcast_arrays(*values)
+
+        return values, self._scale(np.array(values, dtype=float).T)
+
+    def _inside(self, parameters, x):
+        """Flag the points inside of the box. Other parameters than those of the box
+        are only covered if they are equal to the fixed keyword arguments."""
+
+        for key, value in parameters.items():
+            if key not in self.names and not (
+                key in self.kwargs and np.array_equal(self.kwargs[key], value)
+            ):
+                return np.zeros(len(x), dtype=bool)
+
+        return np.all((x >= 0) & (x <= 1), axis=1)
+
+    def inside(self, **parameters):
+        "Flag the parameter sets inside of the box of the surrogate model."
+
+        values, x = self._points(parameters)
+        return self._inside(parameters, x)
+
+    def predict(self, fallback=True, **parameters):
+        """Predict the curves and their standard deviations (``<output>_std``) for
+        (arrays of) parameters. The parameter sets outside of the box are flagged by
+        ``inside`` and evaluated by the function of the simulation if
+        ``fallback=True`` (with a standard deviation of zero) or filled with NaN.
+        Other parameters than those of the box, which differ from the fixed keyword
+        arguments, are not covered by the surrogate model, i.e. all parameter sets
+        are flagged as outside. A ``ValueError`` is raised if a simulated curve has
+        another shape than the curves of the model, e.g. for another ``tension_max``.
+        """
+
+        scalar = all(np.ndim(parameters[name]) == 0 for name in self.names)
+        values, x = self._points(parameters)
+        inside = self._inside(parameters, x)
+
+        r = _correlation(x, self._x, self.length_scales)
+        mean = self._mean + self._std * (r @ self._alpha)
+
+        v = solve_triangular(self._L, r.T, lower=True)
+        variance = np.fmax(1 + self.nugget - np.sum(v**2, axis=0), 0)
+        std = self._std * np.sqrt(variance[:, None] * self._variances)
+
+        mean[~inside] = np.nan
+        std[~inside] = np.nan
+
+        result = {"displacement": self.displacement, "inside": inside}
+        std = self._unpack(std)
+        for key, value in self._unpack(mean).items():
+            result[key] = value
+            result[f"{key}_std"] = std[key]
+
+        # evaluate the parameter sets outside of the box
+        if fallback and not np.all(inside):
+            fun = self.fun
+            if fun is None:
+                from ._simulation import simulate_test_specimen as fun
+
+            for i in np.flatnonzero(~inside):
+                p = {name: value[i].item() for name, value in zip(self.names, values)}
+                res = fun(**{**self.kwargs, **parameters, **p})
+
+                for key in self.outputs:
+                    value = np.asarray(res[key])
+                    if value.shape != result[key].shape[1:]:
+                        raise ValueError(
+                            f"The shape {value.shape} of the simulated {key} does not "
+                            f"match the shape {result[key].shape[1:]} of the "
+                            "surrogate model, e.g. for another number of substeps."
+                        )
+                    result[key][i] = value
+                    result[f"{key}_std"][i] = 0
+
+        if scalar:
+            for key in [*self.outputs, *[f"{key}_std" for key in self.outputs]]:
+                result[key] = result[key][0]
+            result["inside"] = bool(inside[0])
+
+        return result
@@ -0,0 +1,141 @@
+import inspect
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+# environment variables for the number of threads of BLAS, OpenMP and MKL (pardiso)
+thread_variables = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+
+def parameter_grid(**parameters):
+    """Return a list of parameter sets (dicts) of the cartesian product of the given
+    lists of parameter values."""
+
+    keys = list(parameters.keys())
+    values = [np.atleast_1d(value).tolist() for value in parameters.values()]
+
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+
+@contextmanager
+def limit_threads(threads):
+    "Limit the number of threads of BLAS, OpenMP and MKL of (spawned) processes."
+
+    environ = {key: os.environ.get(key) for key in thread_variables}
+    os.environ.update({key: str(threads) for key in thread_variables})
+
+    try:
+        yield
+    finally:
+        for key, value in environ.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _evaluate(fun, parameters, threads):
+    "Evaluate a function with a parameter set, catch and return an exception."
+
+    kwargs = dict(parameters)
+    if "threads" in inspect.signature(fun).parameters:
+        kwargs.setdefault("threads", threads)
+
+    try:
+        return fun(**kwargs), None
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def _stack(results):
+    """Stack the returned items (dicts) of a list of ``(result, error)`` to a columnar
+    store with the arrays ``success`` and ``error``. The returned items of failed
+    evaluations and items of different shapes (or dimensions, e.g. a scalar NaN of a
+    failed evaluation next to an array) are filled with NaN."""
+
+    store = {}
+    store["success"] = np.array([error is None for result, error in results])
+    store["error"] = np.array([error or "" for result, error in results])
+
+    outputs = [result for result, error in results if error is None]
+    for key in dict.fromkeys(key for result in outputs for key in result):
+        values = [np.asarray(result[key], dtype=float) for result in outputs]
+
+        # pad the shapes to a common number of dimensions
+        ndim = max(value.ndim for value in values)
+        shapes = [value.shape + (1,) * (ndim - value.ndim) for value in values]
+        shape = np.max(shapes, axis=0)
+
+        store[key] = np.full((len(results), *shape), np.nan)
+        for i, value, s in zip(np.flatnonzero(store["success"]), values, shapes):
+            store[key][(i, *[slice(n) for n in s])] = value.reshape(s)
+
+    return store
+
+
+def sweep(
+    parameters,
+    fun=None,
+    processes=None,
+    threads=1,
+    filename=None,
+    **kwargs,
+):
+    """Evaluate a function (default ``simulate_test_specimen``) for a list of
+    parameter sets (or a dict of lists of parameter values, evaluated on the
+    cartesian product) on a pool of processes.
+
+    Each process uses ``threads`` threads for BLAS, OpenMP and MKL (pardiso). By
+    default, the number of processes is given by the number of CPUs divided by
+    ``threads``. If ``processes=0``, the parameter sets are evaluated one after
+    another in the current process. Additional keyword arguments are passed to all
+    evaluations of the function.
+
+    Returns a columnar results store, i.e. a dict with one array per parameter, one
+    array per returned item (stacked over the parameter sets) and the arrays
+    ``success`` and ``error``. The returned items of failed parameter sets are filled
+    with NaN. Optionally, the results store is saved to a ``.npz``-file.
+    """
+
+    if fun is None:
+        from ._simulation import simulate_test_specimen as fun
+
+    if isinstance(parameters, dict):
+        parameters = parameter_grid(**parameters)
+
+    if processes is None:
+        processes = max(1, (os.cpu_count() or 1) // threads)
+
+    tasks = [(fun, {**kwargs, **p}, threads) for p in parameters]
+
+    if processes == 0:
+        results = [_evaluate(*task) for task in tasks]
+    else:
+        # spawned processes inherit the limited number of threads on startup
+        with limit_threads(threads):
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(executor.map(_evaluate, *zip(*tasks)))
+
+    # columns of the parameters (missing parameters are filled with NaN)
+    keys = list(dict.fromkeys(key for p in parameters for key in p))
+    store = {key: np.array([p.get(key, np.nan) for p in parameters]) for key in keys}
+
+    store.update(_stack(results))
+
+    if filename is not None:
+        np.savez(filename, **store)
+
+    return store
@@ -0,0 +1,105 @@
+import felupe as fem
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class PointSymmetry:
+    """A point-symmetry constraint for the upper half model of the test specimen, see
+    ``create_test_specimen(half=True)``. It is an item of a step, i.e.
+    ``fem.Step(items=[solid, symmetry], ...)``.
+
+    The test specimen, the two fiber families and the load cases are symmetric under
+    a rotation by 180° about the origin. Hence, the displacements of the points on the
+    cut line ``Y=0`` are related by ``u(X) + u(-X) = u_top``, where ``u_top`` is the
+    (prescribed) displacement of the top edge, taken from a ``reference`` point. The
+    constraint is enforced by a penalty ``multiplier``.
+
+    The results of the half model are reconstructed on the full test specimen by
+    :meth:`reconstruct` on the mesh :attr:`mesh`. The reaction forces of the top edge
+    are the reaction forces of the full test specimen.
+    """
+
+    def __init__(self, field, reference=None, multiplier=1e5, tol=1e-6):
+        self.field = field
+        self.multiplier = multiplier
+
+        mesh = field.region.mesh
+        X = mesh.points
+        dim = X.shape[1]
+
+        # reference point on the top edge with the prescribed displacement
+        if reference is None:
+            reference = np.argmax(X[:, 1])
+
+        self.reference = reference
+
+        # pairs of points on the cut line (incl. the center point paired with itself)
+        cut = np.where(abs(X[:, 1]) <= tol)[0]
+        cut = cut[np.argsort(X[cut, 0])]
+        self.pairs = np.vstack([cut, cut[::-1]]).T
+
+        if not np.allclose(X[self.pairs[:, 0], 0], -X[self.pairs[:, 1], 0], atol=tol):
+            raise ValueError("The points on the cut line are not point-symmetric.")
+
+        # operator of the constraint equations, shape (pairs x dim, points x dim)
+        dof = np.arange(mesh.npoints * dim).reshape(-1, dim)
+        rows = np.arange(len(self.pairs) * dim).reshape(-1, dim)
+        self.operator = csr_matrix(
+            (
+                np.ones(2 * rows.size),
+                (np.concatenate([rows, rows]).ravel(), dof[self.pairs.T].ravel()),
+            ),
+            shape=(rows.size, dof.size),
+        )
+
+        # mesh of the full test specimen (the cut line is shared by both halves)
+        self.npoints = mesh.npoints
+        self.rotated = np.setdiff1d(np.arange(mesh.npoints), cut)
+        index = np.zeros(mesh.npoints, dtype=int)
+        index[self.rotated] = mesh.npoints + np.arange(len(self.rotated))
+        index[self.pairs[:, 0]] = self.pairs[:, 1]
+
+        self.mesh = fem.Mesh(
+            points=np.vstack([X, -X[self.rotated]]),
+            cells=np.vstack([mesh.cells, index[mesh.cells]]),
+            cell_type=mesh.cell_type,
+        )
+
+        self.results = fem.mechanics.Results()
+        self.assemble = fem.mechanics.Assemble(vector=self._vector, matrix=self._matrix)
+
+    def _vector(self, field=None, parallel=False):
+        "Assemble the vector of residuals of the constraint."
+
+        if field is not None:
+            self.field = field
+
+        u = self.field[0].values
+        gap = self.operator @ u.ravel() - np.tile(u[self.reference], len(self.pairs))
+
+        self.results.force = csr_matrix(
+            (self.multiplier * self.operator.T @ gap).reshape(-1, 1)
+        )
+        return self.results.force
+
+    def _matrix(self, field=None, parallel=False):
+        "Assemble the stiffness matrix of the constraint."
+
+        if field is not None:
+            self.field = field
+
+        self.results.stiffness = self.multiplier * (self.operator.T @ self.operator)
+        return self.results.stiffness
+
+    def reconstruct(self, values, displacement=False):
+        """Reconstruct values at the points of the half model on the points of the full
+        test specimen. If ``displacement=True``, the values are displacements, which
+        are rotated and shifted by the displacement of the top edge."""
+
+        values = np.asarray(values)
+        rotated = values[self.rotated]
+
+        if displacement:
+            rotated = values[self.reference] - rotated
+
+        return np.concatenate([values, rotated])
@@ -1,3 +1,6 @@
+import os
+
+from ._cache import MeshCache
 from ._fibers import fibers
 from ._rubber import rubber
 
@@ -12,23 +15,143 @@ def create_test_specimen(
     fiber_axis=1,
     fiber_distance=1,
     n=201,
+    compact=False,
+    cache=None,
+    size=None,
+    size_middle=None,
+    size_radius=None,
+    size_tangential=None,
+    bias=1,
+    bias_radius=1,
+    bias_tangential=1,
+    cell_type="quad",
+    half=False,
 ):
     """Create a solid mesh and two meshes for the two fiber families rotated by
     an ``angle`` around a given ``axis``. Each fiber consists of ``(n-1)`` line-cells.
+
+    If ``compact=True``, the fiber meshes contain only the points of the fibers inside
+    the test specimen and the indices of these points in the (non-compact) grid of
+    points are returned instead of the point masks. Then, no mask is required to
+    interpolate values to the fiber meshes.
+
+    An optional :class:`MeshCache` (or the path of a cache directory) is used to load
+    the meshes of previous calls with the same arguments instead of re-creating them.
+
+    The density of the mesh of the rubber is controlled by the mean cell sizes
+    ``size``, ``size_middle``, ``size_radius`` and ``size_tangential`` (in mm) and
+    the gradings ``bias``, ``bias_radius`` and ``bias_tangential``, i.e. the ratios
+    of the largest to the smallest cell size, which refine the cells towards the
+    notch and the middle strip. By default, the cells are approx. 1 mm. The cells of
+    the rubber are linear (``cell_type="quad"``) or quadratic serendipity
+    (``"quad8"``) or Lagrange (``"quad9"``) quads.
+
+    If ``half=True``, the mesh of the rubber is only the upper half of the test
+    specimen, which is solved with a :class:`PointSymmetry` constraint on the cut line.
+    The fiber meshes are created for the full test specimen, i.e. the results are
+    reconstructed on the full test specimen before they are interpolated.
     """
 
-    mesh_rubber, limit = rubber(width, height, middle, radius, angle)
+    if isinstance(cache, (str, os.PathLike)):
+        cache = MeshCache(cache)
+
+    if cache is not None:
+        key = cache.key(
+            width=width,
+            height=height,
+            middle=middle,
+            radius=radius,
+            angle=angle,
+            fiber_angle=fiber_angle,
+            fiber_axis=fiber_axis,
+            fiber_distance=fiber_distance,
+            n=n,
+            compact=compact,
+            size=size,
+            size_middle=size_middle,
+            size_radius=size_radius,
+            size_tangential=size_tangential,
+            bias=bias,
+            bias_radius=bias_radius,
+            bias_tangential=bias_tangential,
+            cell_type=cell_type,
+            half=half,
+        )
+        meshes = cache.load(key)
+
+        if meshes is None:
+            meshes = create_test_specimen(
+                width,
+                height,
+                middle,
+                radius,
+                angle,
+                fiber_angle,
+                fiber_axis,
+                fiber_distance,
+                n,
+                compact,
+                None,
+                size,
+                size_middle,
+                size_radius,
+                size_tangential,
+                bias,
+                bias_radius,
+                bias_tangential,
+                cell_type,
+                half,
+            )
+            cache.save(key, meshes)
+
+        return meshes
+
+    mesh_rubber, limit = rubber(
+        width,
+        height,
+        middle,
+        radius,
+        angle,
+        size=size,
+        size_middle=size_middle,
+        size_radius=size_radius,
+        size_tangential=size_tangential,
+        bias=bias,
+        bias_radius=bias_radius,
+        bias_tangential=bias_tangential,
+        cell_type=cell_type,
+        half=half,
+    )
 
     # fiber family 1
     mesh_fibers_1, mask_points_1 = fibers(
-        limit, 2 * width, height, middle, -fiber_angle, fiber_axis, fiber_distance, n
+        limit,
+        2 * width,
+        height,
+        middle,
+        -fiber_angle,
+        fiber_axis,
+        fiber_distance,
+        n,
+        compact,
     )
 
     # fiber family 2
     mesh_fibers_2, mask_points_2 = fibers(
-        limit, 2 * width, height, middle, fiber_angle, fiber_axis, fiber_distance, n
+        limit,
+        2 * width,
+        height,
+        middle,
+        fiber_angle,
+        fiber_axis,
+        fiber_distance,
+        n,
+        compact,
     )
 
+    if compact:
+        return mesh_rubber, mesh_fibers_1, mesh_fibers_2, mask_points_1, mask_points_2
+
     mesh_fibers_1.points[mesh_fibers_1.points_without_cells, :] = 0
     mesh_fibers_2.points[mesh_fibers_2.points_without_cells, :] = 0
 
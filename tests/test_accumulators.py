@@ -0,0 +1,92 @@
+import felupe as fem
+import numpy as np
+from pypardiso import spsolve
+
+import fiberreinforcedrubber as frr
+
+
+def test_fiber_force_range():
+    # generate the meshes
+    mesh, fibers_1, fibers_2, mask_points_1, mask_points_2 = frr.create_test_specimen(
+        n=51
+    )
+
+    region = fem.RegionQuad(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=2)])
+    bounds, loadcase = fem.dof.shear(field)
+
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+        fused=True
+    )
+    solid = fem.SolidBody(material, field)
+    projector = frr.Projector(region)
+    interpolators = [
+        frr.Interpolator(mesh, fibers_1, mask_points_1),
+        frr.Interpolator(mesh, fibers_2, mask_points_2),
+    ]
+
+    # streaming accumulators (at the rubber mesh and at the fiber meshes)
+    fiber_force_range = frr.FiberForceRange(
+        solid,
+        5,
+        0.08,
+        vectors=[vector1, vector2],
+        projector=projector,
+        umats=[fibermat1, fibermat2],
+    )
+    fiber_force_range_fibers = frr.FiberForceRange(
+        solid,
+        5,
+        0.08,
+        vectors=[vector1, vector2],
+        projector=projector,
+        umats=[fibermat1, fibermat2],
+        interpolators=interpolators,
+    )
+
+    # reference: store the fiber forces of all substeps
+    fiber_forces = [[], []]
+
+    def store(context, state):
+        for forces, vector, umat in zip(
+            fiber_forces, [vector1, vector2], [fibermat1, fibermat2]
+        ):
+            forces.append(frr.fiber_force(solid, 5, 0.08, vector, projector, umat))
+
+    step = fem.Step(
+        items=[solid],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: fem.math.linsteps([1, 1], num=2),
+            bounds["move"]: 5 * fem.math.linsteps([-1, 1], num=2),
+        },
+    )
+    job = fem.Job(
+        steps=[step], plugins=[fiber_force_range, fiber_force_range_fibers, store]
+    )
+    job.evaluate(solver=spsolve, tol=1e-2)
+
+    assert fiber_force_range.nsubsteps == 3
+
+    forces = np.array(fiber_forces)
+    ranges = forces.max(axis=1) - forces.min(axis=1)
+    difference = np.abs(forces[0] - forces[1]).max(axis=0)
+
+    assert np.allclose(fiber_force_range.range, ranges)
+    assert np.allclose(fiber_force_range.max_range, ranges.max(axis=0))
+    assert np.allclose(fiber_force_range.difference, difference)
+    assert np.allclose(fiber_force_range.force, forces[:, -1])
+
+    # double amplitude between the first and the last substep
+    amplitude = np.abs(forces[:, -1] - forces[:, 0])
+    assert np.allclose(fiber_force_range.double_amplitude, amplitude)
+    assert np.allclose(fiber_force_range.max_double_amplitude, amplitude.max(axis=0))
+
+    for k, interpolate in enumerate(interpolators):
+        values = np.array([interpolate(force) for force in fiber_forces[k]])
+        assert np.allclose(fiber_force_range_fibers.min[k], values.min(axis=0))
+        assert np.allclose(fiber_force_range_fibers.max[k], values.max(axis=0))
+
+
+if __name__ == "__main__":
+    test_fiber_force_range()
@@ -0,0 +1,42 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_branches():
+    kwargs = dict(
+        tension_max=4,
+        tol=1e-6,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )
+
+    # a lateral amplitude, a cycle shape and a failing branch
+    lateral = [5, fem.math.linsteps([0, 5, -5, 0], num=5), [0, np.nan]]
+
+    res = frr.branches(lateral, processes=2, **kwargs)
+    res_serial = frr.branches(lateral, processes=0, **kwargs)
+
+    assert np.all(res["success"] == [True, True, False])
+    assert res["force_tensionshear"].shape == (3, 16)
+
+    for key in ["force_tension", "force_tensionshear", "force_lateral"]:
+        assert np.allclose(res[key], res_serial[key], equal_nan=True)
+
+    # the shared pre-tension
+    res_tension = frr.simulate_test_specimen(lateral_max=5, **kwargs)
+    assert np.allclose(res["force_tension"], res_tension["force_tension"])
+
+    # the branches start from the same pre-tensioned state
+    assert np.allclose(res["force_tensionshear"][:2, 0], res["force_tension"][-1])
+    assert np.allclose(res["force_lateral"][0, 5], res["force_lateral"][1, 5])
+    assert np.all(np.isnan(res["force_lateral"][0, 6:]))
+
+
+if __name__ == "__main__":
+    test_branches()
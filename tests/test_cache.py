@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_cache():
+    with tempfile.TemporaryDirectory() as path:
+        # create and cache the meshes
+        meshes = frr.create_test_specimen(n=51, cache=path)
+        cached = frr.create_test_specimen(n=51, cache=path)
+
+        assert len(os.listdir(path)) == 1
+
+        for mesh, cached_mesh in zip(meshes[:3], cached[:3]):
+            assert np.allclose(mesh.points, cached_mesh.points)
+            assert np.all(mesh.cells == cached_mesh.cells)
+            assert mesh.cell_type == cached_mesh.cell_type
+
+        for mask, cached_mask in zip(meshes[3:], cached[3:]):
+            assert np.all(mask == cached_mask)
+
+        # limit the size of the cache to the most recently used entry
+        size = os.path.getsize(os.path.join(path, os.listdir(path)[0]))
+        cache = frr.MeshCache(path, max_size=1.5 * size)
+
+        frr.create_test_specimen(n=51, fiber_angle=20, cache=cache)
+        entries = os.listdir(path)
+
+        frr.create_test_specimen(n=51, fiber_angle=20, cache=cache)
+
+        assert len(entries) == 1
+        assert os.listdir(path) == entries
+
+        cache.clear()
+
+        assert len(os.listdir(path)) == 0
+
+
+if __name__ == "__main__":
+    test_cache()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_checkpoint():
+    thickness = 5
+    fiber_area = 0.08
+    mesh = frr.create_test_specimen(n=11, size=2.5)[0]
+    region = fem.RegionQuad(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=2)])
+    bounds = fem.dof.shear(field, return_loadcase=False)
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+        thickness=thickness, fiber_area=fiber_area, fused=True
+    )
+    solid = fem.SolidBody(material, field)
+    projector = frr.Projector(region)
+
+    # tension, tension and shear and a further cycle of shear
+    steps = [
+        fem.Step(
+            items=[solid],
+            boundaries=bounds,
+            ramp={
+                bounds["compression_top"]: fem.math.linsteps([0, 4], num=4),
+                bounds["move"]: fem.math.linsteps([0, 0], num=4),
+            },
+        ),
+        fem.Step(
+            items=[solid],
+            boundaries=bounds,
+            ramp={
+                bounds["compression_top"]: fem.math.linsteps([4, 4], num=8),
+                bounds["move"]: fem.math.linsteps([0, 10, -10], num=4),
+            },
+        ),
+    ]
+
+    def accumulator():
+        return frr.FiberForceRange(
+            solid,
+            thickness,
+            fiber_area,
+            vectors=[vector1, vector2],
+            projector=projector,
+            umats=[fibermat1, fibermat2],
+        )
+
+    def reset():
+        field[0].values[:] = 0
+        for boundary in bounds.values():
+            boundary.update(0)
+
+    kwargs = dict(solver=frr.PardisoSolver(), tol=1e-6, verbose=False)
+
+    # the uninterrupted job
+    reference = accumulator()
+    fem.Job(steps, plugins=[reference]).evaluate(**kwargs)
+    values = field[0].values.copy()
+
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, "checkpoint.npz")
+
+        # a job which dies at the 4th substep of the second step
+        def interrupt(context, state):
+            if (state.stepnumber, state.substepnumber) == (1, 3):
+                raise RuntimeError("interrupted")
+
+        reset()
+        force_range = accumulator()
+        checkpoint = frr.Checkpoint(
+            filename, interval=2, accumulators={"range": force_range}
+        )
+
+        try:
+            plugins = [force_range, interrupt, checkpoint]
+            fem.Job(steps, plugins=plugins).evaluate(**kwargs)
+        except RuntimeError:
+            pass
+
+        assert checkpoint.position == (1, 2)
+
+        # only the accumulated attributes are written, not the configuration
+        with np.load(filename) as data:
+            assert "accumulators/range/max/0" in data
+            assert "accumulators/range/thickness" not in data
+
+        # resume the job from the last checkpoint with a fresh state
+        reset()
+        force_range = accumulator()
+        checkpoint = frr.Checkpoint(
+            filename, interval=2, accumulators={"range": force_range}
+        )
+        remaining = checkpoint.resume(steps)
+
+        assert force_range.nsubsteps == 5 + 3
+        assert checkpoint.nsubsteps == 5 + 3
+        assert len(remaining) == 1 and remaining[0].nsubsteps == 6
+
+        fem.Job(remaining, plugins=[force_range, checkpoint]).evaluate(**kwargs)
+
+        assert checkpoint.position == (1, 8)
+        assert force_range.nsubsteps == reference.nsubsteps
+        assert checkpoint.nsubsteps == reference.nsubsteps
+        assert np.allclose(field[0].values, values)
+
+        for fmax, fmax_reference in zip(force_range.max, reference.max):
+            assert np.allclose(fmax, fmax_reference)
+
+        # branch a load path from the pre-tensioned state
+        assert checkpoint.load(steps) == (1, 8)
+        assert np.allclose(field[0].values, values)
+
+
+if __name__ == "__main__":
+    test_checkpoint()
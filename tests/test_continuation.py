@@ -0,0 +1,64 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_continuation():
+    kwargs = dict(
+        tension_max=4,
+        lateral_max=10,
+        tol=1e-6,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )
+    angles = np.linspace(15, 16, 4)
+
+    # cold starts: count the Newton-Raphson iterations by the calls of the solver
+    profiler = frr.Profiler()
+    cold = [
+        frr.simulate_test_specimen(fiber_angle=a, profiler=profiler, **kwargs)
+        for a in angles
+    ]
+    iterations = sum(
+        row["calls"] for row in profiler.summary() if row["phase"] == "solve"
+    )
+
+    # warm starts by the solutions of the previous variants
+    continuation = frr.Continuation()
+    warm = [
+        frr.simulate_test_specimen(fiber_angle=a, continuation=continuation, **kwargs)
+        for a in angles
+    ]
+
+    assert continuation.warm_starts == 3 * 2 * 5
+    assert continuation.fallbacks == 0
+    assert continuation.iterations < 0.75 * iterations
+
+    for res_cold, res_warm in zip(cold, warm):
+        for label in ["force_tension", "force_tensionshear", "force_lateral"]:
+            assert np.allclose(res_warm[label], res_cold[label], rtol=1e-4, atol=1e-3)
+
+    # a failed warm-started substep is solved again, starting from the load path
+    for values in continuation.solutions.values():
+        values[0][:] = np.nan
+
+    res = frr.simulate_test_specimen(
+        fiber_angle=angles[-1],
+        continuation=frr.Continuation(extrapolate=False),
+        **kwargs,
+    )
+    continuation.restart()
+    res_fallback = frr.simulate_test_specimen(
+        fiber_angle=angles[-1], continuation=continuation, **kwargs
+    )
+
+    assert continuation.fallbacks == 2 * 5
+    assert np.allclose(res_fallback["force_lateral"], res["force_lateral"])
+
+
+if __name__ == "__main__":
+    test_continuation()
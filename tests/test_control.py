@@ -0,0 +1,71 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_force_control():
+    thickness = 5
+    mesh = frr.create_test_specimen(n=11, size=2.5)[0]
+    field = fem.FieldContainer([fem.Field(fem.RegionQuad(mesh), dim=2)])
+    bounds = fem.dof.shear(field, return_loadcase=False)
+    solid = fem.SolidBody(
+        frr.fiber_reinforced_rubber(thickness=thickness, fused=True)[0], field
+    )
+    kwargs = dict(solver=frr.PardisoSolver(), tol=1e-6)
+
+    # tension and shear at Fy = 3 kN
+    res = frr.force_control(
+        field,
+        items=[solid],
+        boundaries=bounds,
+        boundary=bounds["compression_top"],
+        force=3e3 / thickness,
+        reaction=bounds["move"],
+        values={bounds["move"]: 23},
+        rtol=1e-6,
+        **kwargs,
+    )
+
+    assert res["iterations"] < 10
+    assert np.isclose(res["force"][1] * thickness, 3e3, rtol=1e-6)
+    assert np.allclose(
+        field[0].values[bounds["move"].points], [23, res["displacement"]]
+    )
+
+    # the displacement-controlled load case results in the same reaction force
+    field[0].values[:] = 0
+    step = fem.Step(
+        items=[solid],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: np.array([res["displacement"]]),
+            bounds["move"]: np.array([23.0]),
+        },
+    )
+    curve = fem.CharacteristicCurve(steps=[step], boundary=bounds["move"])
+    curve.evaluate(**kwargs)
+
+    assert np.allclose(curve.y[-1], res["force"], rtol=1e-5)
+
+    # a flat response (two equal initial guesses) is not divided by zero
+    try:
+        frr.force_control(
+            field,
+            items=[solid],
+            boundaries=bounds,
+            boundary=bounds["compression_top"],
+            force=2e3 / thickness,
+            reaction=bounds["move"],
+            guess=[2, 2],
+            **kwargs,
+        )
+        flat = False
+    except fem.NewtonConvergenceError as error:
+        flat = "did not change" in str(error)
+
+    assert flat
+
+
+if __name__ == "__main__":
+    test_force_control()
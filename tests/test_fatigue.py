@@ -0,0 +1,88 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def rainflow_reference(history):
+    "Rainflow counting (ASTM E1049) of a single history, point by point."
+
+    # reversals
+    values = [history[0]]
+    for value in history[1:]:
+        if value == values[-1]:
+            continue
+        if len(values) > 1 and (values[-1] - values[-2]) * (value - values[-1]) > 0:
+            values[-1] = value
+        else:
+            values.append(value)
+
+    cycles = []
+    stack = []
+    for value in values:
+        stack.append(value)
+        while len(stack) >= 3:
+            X = abs(stack[-1] - stack[-2])
+            Y = abs(stack[-2] - stack[-3])
+            if X < Y:
+                break
+            if len(stack) == 3:
+                cycles.append((Y, 0.5))
+                stack.pop(0)
+            else:
+                cycles.append((Y, 1.0))
+                del stack[-3:-1]
+
+    for a, b in zip(stack[:-1], stack[1:]):
+        cycles.append((abs(b - a), 0.5))
+
+    return cycles
+
+
+def test_rainflow():
+    # example of ASTM E1049, Fig. 6
+    history = np.array([-2, 1, -3, 5, -1, 3, -4, 4, -2], dtype=float)
+    rainflow = frr.Rainflow(1).update(history.reshape(-1, 1)).finish()
+
+    assert np.isclose(rainflow.cycles[0], 4)
+    assert np.isclose(rainflow.max_range[0], 9)
+
+    # random histories of many points
+    np.random.seed(9)
+    history = np.random.normal(size=(400, 50)).cumsum(axis=0)
+    history[:100, 3] = np.nan
+
+    damage = frr.basquin(exponent=5, reference_range=10, reference_cycles=1e3)
+    rainflow = frr.Rainflow(50, damage=damage, depth=2).update(history).finish()
+
+    for point in range(50):
+        values = history[:, point]
+        cycles = np.array(rainflow_reference(values[~np.isnan(values)]))
+
+        assert np.isclose(rainflow.cycles[point], cycles[:, 1].sum())
+        assert np.isclose(rainflow.max_range[point], cycles[:, 0].max())
+        assert np.isclose(
+            rainflow.damage[point], np.sum(cycles[:, 1] * damage(cycles[:, 0]))
+        )
+
+    # streamed chunks of the history
+    chunks = (history[i : i + 64] for i in range(0, len(history), 64))
+    results = frr.rainflow_damage(
+        chunks, exponent=5, reference_range=10, reference_cycles=1e3
+    )
+
+    assert np.allclose(results[0], rainflow.damage)
+    assert np.allclose(results[1], rainflow.cycles)
+    assert np.allclose(results[2], rainflow.max_range)
+
+    # an empty iterable of chunks
+    try:
+        frr.rainflow_damage(iter([]))
+        raised = False
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+if __name__ == "__main__":
+    test_rainflow()
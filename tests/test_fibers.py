@@ -0,0 +1,89 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+from fiberreinforcedrubber._fibers import fibers
+from fiberreinforcedrubber._rubber import rubber
+
+
+def fibers_reference(limit, width, height, angle, axis, fiber_distance, n):
+    "The fibers of a rotated mesh of the full grid (as in version 1.0.2)."
+
+    H = 2 * height
+    W = 2 * width
+    center = np.array([H / 2, W / 2])
+
+    x, y = np.meshgrid(
+        np.linspace(0, H, n), np.arange(0, W + fiber_distance, fiber_distance)
+    )
+    points = np.vstack((x.ravel(), y.ravel())).T
+
+    cells = np.repeat(np.arange(0, len(points)), 2)[1:-1].reshape(-1, 2)
+    mask = np.ones(len(cells), dtype=bool)
+    mask[np.arange(0, len(cells), n)[1:] - 1] = False
+    cells = cells[mask]
+
+    mesh = fem.Mesh(points, cells, "line")
+    angle_mean = {0: 0, 1: 90}[axis]
+    mesh = fem.mesh.rotate(mesh, angle_deg=angle_mean + angle, axis=2, center=center)
+    mesh.points -= center
+
+    p = mesh.points
+    mask_points = np.logical_and(
+        np.logical_and(p[:, 0] >= -limit(p[:, 1]), p[:, 0] <= limit(p[:, 1])),
+        np.logical_and(p[:, 1] >= -height / 2, p[:, 1] <= height / 2),
+    )
+    points_to_keep = np.arange(len(p))[mask_points]
+    mask_cells = np.all(np.isin(mesh.cells, points_to_keep), axis=1)
+
+    return fem.Mesh(mesh.points, mesh.cells[mask_cells], "line"), mask_points
+
+
+def test_fibers_reference():
+    mesh, limit = rubber(50, 50, 5, 20, 120)
+
+    # axis-aligned fibers with points on the edges of the test specimen
+    for angle, axis in [(0, 1), (90, 0), (90, 1), (15, 1), (-15, 0)]:
+        for fiber_distance in [1, 1 / 0.95, 0.5]:
+            args = (limit, 100, 50, 5, angle, axis, fiber_distance, 101)
+            mesh, mask = fibers(*args)
+            reference, mask_reference = fibers_reference(
+                limit, 100, 50, angle, axis, fiber_distance, 101
+            )
+
+            assert np.all(mask == mask_reference)
+            assert np.allclose(mesh.points, reference.points)
+            assert np.all(mesh.cells == reference.cells)
+
+
+def test_fibers_compact():
+    # generate the meshes with and without compact fiber meshes
+    mesh, fibers_1, fibers_2, mask_points_1, mask_points_2 = frr.create_test_specimen(
+        n=101
+    )
+    mesh, compact_1, compact_2, points_1, points_2 = frr.create_test_specimen(
+        n=101, compact=True
+    )
+
+    # the compact fiber meshes contain only the points connected to line-cells
+    for fibers, compact, mask, points in [
+        (fibers_1, compact_1, mask_points_1, points_1),
+        (fibers_2, compact_2, mask_points_2, points_2),
+    ]:
+        assert compact.npoints < fibers.npoints
+        assert len(compact.points_without_cells) == 0
+        assert np.all(mask[points])
+        assert np.allclose(compact.points, fibers.points[points])
+        assert np.all(points[compact.cells] == fibers.cells)
+
+        # interpolate values to the compact fiber meshes (without a mask)
+        values = mesh.points**2
+        u = frr.interpolate(mesh, values, fibers, mask)
+        v = frr.interpolate(mesh, values, compact)
+
+        assert np.allclose(v, u[points])
+
+
+if __name__ == "__main__":
+    test_fibers_reference()
+    test_fibers_compact()
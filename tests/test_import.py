@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+
+def imported_modules(code):
+    "Return the heavy dependencies which are imported by the code."
+
+    code += "; import sys; print(*sorted(sys.modules))"
+    modules = subprocess.check_output([sys.executable, "-c", code], text=True)
+    modules = modules.split()
+
+    return [
+        m for m in ["felupe", "matadi", "casadi", "scipy", "pypardiso"] if m in modules
+    ]
+
+
+def test_lazy_import():
+    assert imported_modules("import fiberreinforcedrubber") == []
+    assert imported_modules("import fiberreinforcedrubber as frr; frr.Rainflow") == []
+    assert imported_modules("import fiberreinforcedrubber as frr; frr.sweep") == []
+    assert "matadi" in imported_modules(
+        "from fiberreinforcedrubber import fiber_reinforced_rubber"
+    )
+
+    import fiberreinforcedrubber as frr
+
+    for name in frr.__all__:
+        assert hasattr(frr, name)
+        assert name in dir(frr)
+
+
+if __name__ == "__main__":
+    test_lazy_import()
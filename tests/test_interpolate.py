@@ -0,0 +1,66 @@
+import felupe as fem
+import numpy as np
+from scipy.interpolate import griddata
+
+import fiberreinforcedrubber as frr
+
+
+def test_interpolate():
+    # generate the meshes
+    mesh, fibers_1, fibers_2, mask_points_1, mask_points_2 = frr.create_test_specimen(
+        n=51
+    )
+
+    # point values on the rubber mesh
+    values = np.vstack([mesh.points[:, 0] ** 2, mesh.points[:, 1]]).T
+
+    # reference values by a linear interpolation on the masked fiber points
+    u = np.zeros_like(fibers_1.points)
+    u[mask_points_1] = griddata(mesh.points, values, fibers_1.points[mask_points_1])
+
+    # re-use the interpolation operator for scalar and vector values
+    interpolate_1 = frr.Interpolator(mesh, fibers_1, mask_points_1)
+
+    assert np.allclose(interpolate_1(values), u)
+    assert np.allclose(interpolate_1(values[:, 0]), u[:, 0])
+    assert np.allclose(frr.interpolate(mesh, values, fibers_1, mask_points_1), u)
+
+
+def test_interpolate_isoparametric():
+    # generate the meshes
+    mesh, fibers_1, fibers_2, mask_points_1, mask_points_2 = frr.create_test_specimen(
+        n=51
+    )
+
+    # points with known cells and local coordinates
+    np.random.seed(5)
+    cells = np.random.randint(0, mesh.ncells, size=100)
+    rs = np.random.uniform(-0.95, 0.95, size=(2, 100))
+    h = frr.shape_functions(mesh.cell_type, rs)[0]
+    points = np.einsum("ap,pai->pi", h, mesh.points[mesh.cells[cells]])
+
+    cells_located, rs_located = frr.locate(mesh, points)
+
+    assert np.all(cells_located == cells)
+    assert np.allclose(rs_located, rs.T)
+
+    # interpolated point values match the shape functions of the cells
+    values = np.vstack([mesh.points[:, 0] ** 2, mesh.points[:, 1]]).T
+    fibers = fem.Mesh(points, np.arange(100).reshape(-1, 2), cell_type="line")
+    u = frr.interpolate(mesh, values, fibers, method="isoparametric")
+
+    assert np.allclose(u, np.einsum("ap,pai->pi", h, values[mesh.cells[cells]]))
+
+    # interpolate to the fiber meshes
+    interpolate_1 = frr.Interpolator(
+        mesh, fibers_1, mask_points_1, method="isoparametric"
+    )
+    u = interpolate_1(values)
+
+    assert not np.any(np.isnan(u))
+    assert np.allclose(u[~mask_points_1], 0)
+
+
+if __name__ == "__main__":
+    test_interpolate()
+    test_interpolate_isoparametric()
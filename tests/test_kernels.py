@@ -0,0 +1,55 @@
+import os
+import tempfile
+import warnings
+
+import matadi as mat
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_compiled_material():
+    np.random.seed(13)
+    F = np.eye(2).reshape(2, 2, 1, 1) + 0.1 * np.random.normal(size=(2, 2, 4, 50))
+
+    materials = frr.fiber_reinforced_rubber(fused=True)
+
+    with tempfile.TemporaryDirectory() as path:
+        cache = frr.KernelCache(path)
+
+        for i in range(2):
+            compiled = frr.fiber_reinforced_rubber(
+                fused=True, compiled=True, cache=cache
+            )
+
+            # one compiled library per material (re-used on the second call)
+            assert len(os.listdir(path)) == 3
+
+        for umat, umat_compiled in zip(materials[:3], compiled[:3]):
+            assert np.allclose(umat.gradient([F])[0], umat_compiled.gradient([F])[0])
+            assert np.allclose(umat.hessian([F])[0], umat_compiled.hessian([F])[0])
+
+        # a new compiled library for different parameters
+        umat = frr.compiled_material(mat.models.neo_hooke, cache=path, C10=0.6)
+
+        assert len(os.listdir(path)) == 4
+        assert np.allclose(
+            umat.gradient([F])[0],
+            mat.MaterialHyperelasticPlaneStressIncompressible(
+                mat.models.neo_hooke, C10=0.6
+            ).gradient([F])[0],
+        )
+
+        # fall back to the non-compiled material formulation
+        cache = frr.KernelCache(path, compiler="non-existing-compiler")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            umat = frr.compiled_material(mat.models.neo_hooke, cache=cache, C10=0.7)
+
+        assert len(w) == 1
+        assert isinstance(umat, mat.MaterialHyperelasticPlaneStressIncompressible)
+
+
+if __name__ == "__main__":
+    test_compiled_material()
@@ -0,0 +1,64 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_materials_fused():
+    # deformation gradients at 4 quadrature-points of 3 cells
+    np.random.seed(4)
+    F = np.eye(2).reshape(2, 2, 1, 1) + np.random.uniform(-0.2, 0.2, (2, 2, 4, 3))
+    statevars = np.zeros((0, 4, 3))
+
+    # separated and combined material formulations
+    rubber, fiber1, fiber2, vector1, vector2 = frr.fiber_reinforced_rubber(
+        strain_exponent=1
+    )
+    material, fibermat1, fibermat2, v1, v2 = frr.fiber_reinforced_rubber(
+        strain_exponent=1, fused=True
+    )
+
+    P = [umat.gradient([F, statevars])[0] for umat in [rubber, fiber1, fiber2]]
+    A = [umat.hessian([F, statevars])[0] for umat in [rubber, fiber1, fiber2]]
+
+    assert np.allclose(material.gradient([F, statevars])[0], sum(P))
+    assert np.allclose(material.hessian([F, statevars])[0], sum(A))
+    assert np.allclose(fibermat1.gradient([F, statevars])[0], P[1])
+    assert np.allclose(v1, vector1)
+    assert np.allclose(v2, vector2)
+
+
+def test_materials_batch():
+    # deformation gradients at 4 quadrature-points of 3 cells
+    np.random.seed(4)
+    F = np.eye(2).reshape(2, 2, 1, 1) + np.random.uniform(-0.2, 0.2, (2, 2, 4, 3))
+    statevars = np.zeros((0, 4, 3))
+
+    # variants of the material parameters (with fibers in tension and compression)
+    variants = dict(
+        C10=[0.5, 0.4, 0.6, 0.5],
+        fiber_angle=[0, 15, 30, 45],
+        fiber_modulus=[3600, 5500, 2000, 3600],
+        fiber_distance=[1, 1 / 0.95, 2, 1],
+        strain_exponent=[0, 1, 2, 1],
+    )
+    material = frr.FiberReinforcedRubberBatch(axis=0, **variants)
+
+    P = material.gradient([F, statevars])[0]
+    A = material.hessian([F, statevars])[0]
+
+    assert material.nvariants == 4
+    assert P.shape == (2, 2, 4, 3, 4)
+    assert A.shape == (2, 2, 2, 2, 4, 3, 4)
+
+    for v in range(material.nvariants):
+        umat = frr.fiber_reinforced_rubber(
+            axis=0, fused=True, **{key: value[v] for key, value in variants.items()}
+        )[0]
+
+        assert np.allclose(P[..., v], umat.gradient([F, statevars])[0])
+        assert np.allclose(A[..., v], umat.hessian([F, statevars])[0])
+
+
+if __name__ == "__main__":
+    test_materials_fused()
+    test_materials_batch()
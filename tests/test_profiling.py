@@ -0,0 +1,92 @@
+import csv
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_profiler_phases():
+    profiler = frr.Profiler(memory=True)
+
+    # nested phases record exclusive times and the peak memory
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            time.sleep(0.05)
+            x = np.ones(10**6)
+        del x
+
+    summary = {row["phase"]: row for row in profiler.summary()}
+
+    assert summary["inner"]["time"] >= 0.05
+    assert summary["outer"]["time"] < 0.05
+    assert summary["inner"]["peak_memory"] >= 8 * 10**6
+    assert summary["outer"]["peak_memory"] >= 8 * 10**6
+
+    # the tracing of the memory is stopped after the outermost phase
+    assert not tracemalloc.is_tracing()
+
+    # wrapped functions and solvers
+    fun = profiler.wrap(np.sum, "sum")
+    solver = profiler.solver(lambda A, b: b)
+
+    assert fun([1, 2]) == 3
+    solver(None, 1)
+    profiler.complete()
+
+    assert profiler.iteration == 0
+    assert profiler.substep == 1
+    assert (0, 0, "sum") in profiler.records
+    assert (0, 0, "solve") in profiler.records
+
+
+def test_profiler_simulation():
+    profiler = frr.Profiler()
+    frr.simulate_test_specimen(tension_max=1, lateral_max=5, profiler=profiler)
+
+    phases = [row["phase"] for row in profiler.summary()]
+    table = profiler.table()
+
+    assert set(phases) == {"material", "assembly", "solve"}
+    assert profiler.substep == 4
+    assert max(row["iteration"] for row in table) > 0
+
+    with tempfile.TemporaryDirectory() as path:
+        profiler.to_json(os.path.join(path, "profile.json"))
+        profiler.to_csv(os.path.join(path, "profile.csv"))
+
+        with open(os.path.join(path, "profile.json")) as file:
+            assert len(json.load(file)) == len(table)
+
+        with open(os.path.join(path, "profile.csv")) as file:
+            assert len(list(csv.DictReader(file))) == len(table)
+
+
+def test_profiler_simulation_failed():
+    def solver(A, b):
+        raise np.linalg.LinAlgError("The matrix is singular.")
+
+    # the instrumented methods are released after a failed evaluation
+    profiler = frr.Profiler(memory=True)
+
+    try:
+        frr.simulate_test_specimen(
+            tension_max=1, lateral_max=5, solver=solver, profiler=profiler
+        )
+        failed = False
+    except np.linalg.LinAlgError:
+        failed = True
+
+    assert failed
+    assert len(profiler._originals) == 0
+    assert not tracemalloc.is_tracing()
+
+
+if __name__ == "__main__":
+    test_profiler_phases()
+    test_profiler_simulation()
+    test_profiler_simulation_failed()
@@ -0,0 +1,30 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_project():
+    # a numeric region on the mesh of the test specimen
+    mesh = frr.create_test_specimen(n=11)[0]
+    region = fem.RegionQuad(mesh)
+
+    # values at the quadrature-points of the cells
+    np.random.seed(2)
+    values = np.random.rand(2, region.quadrature.npoints, mesh.ncells)
+
+    # re-use the projection operator for vector and scalar values
+    projector = frr.Projector(region)
+
+    assert np.allclose(projector(values), fem.project(values, region))
+    assert np.allclose(projector(values[0]), fem.project(values[0], region))
+
+    # a lumped projection preserves constant values
+    projector = frr.Projector(region, lumped=True)
+    ones = np.ones((region.quadrature.npoints, mesh.ncells))
+
+    assert np.allclose(projector(ones), 1)
+
+
+if __name__ == "__main__":
+    test_project()
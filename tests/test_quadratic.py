@@ -0,0 +1,77 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def fiber_forces(cell_type, region, method, **kwargs):
+    "Solve the tension of the test specimen and interpolate the fiber forces."
+
+    mesh, fibers_1, fibers_2, points_1, points_2 = frr.create_test_specimen(
+        n=101, compact=True, cell_type=cell_type, **kwargs
+    )
+    field = fem.FieldContainer([fem.Field(region(mesh), dim=2)])
+    bounds, loadcase = fem.dof.shear(field)
+
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+        fused=True
+    )
+    solid = fem.SolidBody(material, field)
+
+    step = fem.Step(
+        items=[solid],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: fem.math.linsteps([0, 4], num=4),
+            bounds["move"]: fem.math.linsteps([0, 0], num=4),
+        },
+    )
+    fem.Job(steps=[step]).evaluate(solver=frr.PardisoSolver(), tol=1e-2, verbose=0)
+
+    projector = frr.Projector(field.region)
+    force = frr.fiber_force(solid, 5, 0.08, vector1, projector, umat=fibermat1)
+
+    return mesh, frr.interpolate(mesh, force, fibers_1, method=method)
+
+
+def test_quadratic():
+    # the midpoints of quadratic cells are located on the notch radius
+    for cell_type, region in [
+        ("quad8", fem.RegionQuadraticQuad),
+        ("quad9", fem.RegionBiQuadraticQuad),
+    ]:
+        mesh = frr.create_test_specimen(n=11, cell_type=cell_type, size=5)[0]
+        assert mesh.cell_type == cell_type
+        assert len(mesh.points_without_cells) == 0
+        assert np.all(region(mesh).dV > 0)
+
+    # fiber forces of a coarse quadratic mesh and of the (default) linear mesh
+    mesh, force = fiber_forces("quad", fem.RegionQuad, "linear")
+    mesh8, force8 = fiber_forces(
+        "quad8",
+        fem.RegionQuadraticQuad,
+        "isoparametric",
+        size=5,
+        size_middle=1.25,
+        size_radius=2.5,
+        bias=3,
+        bias_radius=3,
+        bias_tangential=3,
+    )
+
+    assert mesh8.npoints < mesh.npoints / 2
+    assert np.isclose(np.nanmax(force8), np.nanmax(force), rtol=0.05)
+
+    # force-displacement curves of the coarse quadratic mesh
+    kwargs = dict(tension_max=2, lateral_max=5)
+    res = frr.simulate_test_specimen(**kwargs)
+    res8 = frr.simulate_test_specimen(
+        cell_type="quad8", size=5, size_middle=1.25, size_radius=2.5, **kwargs
+    )
+
+    for label in ["force_tension", "force_tensionshear", "force_lateral"]:
+        assert np.allclose(res8[label], res[label], rtol=1e-2, atol=1)
+
+
+if __name__ == "__main__":
+    test_quadratic()
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_results():
+    kwargs = dict(
+        tension_max=4,
+        lateral_max=10,
+        tol=1e-6,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )
+
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, "results.h5")
+        res = frr.simulate_test_specimen(results=filename, **kwargs)
+
+        with frr.read_results(filename) as file:
+            assert list(file.keys()) == ["tension", "tensionshear"]
+
+            group = file["tensionshear"]
+            parameters = json.loads(group.attrs["parameters"])
+            npoints = len(group["points"])
+
+            assert parameters["lateral_max"] == 10
+            assert group.attrs["fiber_angle"] == 15
+
+            # one substep per chunk, compressed datasets
+            assert group["fiber_force_1"].shape == (5, npoints, 2)
+            assert group["fiber_force_1"].chunks == (1, npoints, 2)
+            assert group["fiber_force_1"].compression == "gzip"
+            assert group["stress"].shape == (5, npoints, 2, 2)
+
+            # slices of the datasets, e.g. the first fiber family of a point
+            assert group["fiber_force_2"][:, 0].shape == (5, 2)
+            assert np.allclose(group["displacement"][:, :, 0].max(axis=1), 10)
+            assert np.allclose(group["substep"][:], np.arange(5))
+
+            for label, key in [
+                ("tension", "force_tension"),
+                ("tensionshear", "force_tensionshear"),
+            ]:
+                force = file[label]["reaction_force/move"][:, 1] * 5
+                assert np.allclose(force, res[key])
+
+
+if __name__ == "__main__":
+    test_results()
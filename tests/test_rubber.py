@@ -0,0 +1,61 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_rubber_size_bias():
+    # default mesh with approx. 1 mm cells
+    mesh = frr.create_test_specimen(n=11)[0]
+    area = fem.RegionQuad(mesh).dV.sum()
+
+    # coarse mesh with graded cells towards the notch and the middle strip
+    coarse = frr.create_test_specimen(
+        n=11,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )[0]
+    region = fem.RegionQuad(coarse)
+
+    assert coarse.npoints < mesh.npoints / 2
+    assert len(coarse.points_without_cells) == 0
+    assert np.all(region.dV > 0)
+    assert np.isclose(region.dV.sum(), area, rtol=1e-3)
+
+    # symmetric mesh, refined at the notch
+    assert np.allclose(np.sort(coarse.points[:, 0]), np.sort(-coarse.points[:, 0]))
+    x = np.unique(coarse.points[np.isclose(coarse.points[:, 1], 0), 0])
+    dx = np.diff(x[x >= 0])
+    assert dx[-1] < dx[0] / 2
+
+    # a refined middle strip on top of the default mesh
+    middle = frr.create_test_specimen(n=11, size_middle=0.25)[0]
+    y = np.unique(middle.points[np.abs(middle.points[:, 1]) <= 2.5, 1])
+    y_default = np.unique(mesh.points[np.abs(mesh.points[:, 1]) <= 2.5, 1])
+
+    assert len(y) > 2 * len(y_default)
+    assert np.allclose(np.unique(middle.points[:, 0]), np.unique(mesh.points[:, 0]))
+
+    # the reaction forces of the coarse mesh are close to those of the default mesh
+    kwargs = dict(tension_max=2, lateral_max=5)
+    res = frr.simulate_test_specimen(**kwargs)
+    res_coarse = frr.simulate_test_specimen(
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+        **kwargs,
+    )
+
+    for label in ["force_tension", "force_tensionshear", "force_lateral"]:
+        assert np.allclose(res_coarse[label], res[label], rtol=1e-2, atol=1)
+
+
+if __name__ == "__main__":
+    test_rubber_size_bias()
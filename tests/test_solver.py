@@ -0,0 +1,42 @@
+import numpy as np
+from scipy.sparse import eye, random
+from scipy.sparse.linalg import spsolve
+
+import fiberreinforcedrubber as frr
+
+
+def test_pardiso_solver():
+    np.random.seed(7)
+    A = (random(200, 200, density=0.05, random_state=7) + 10 * eye(200)).tocsr()
+    b = np.random.rand(200)
+
+    solver = frr.PardisoSolver()
+
+    # same sparsity pattern with different values (e.g. Newton iterations)
+    for i in range(3):
+        A.data *= 1.1
+        assert np.allclose(solver(A, b), spsolve(A, b))
+
+    assert solver.nanalysis == 1
+
+    # a new sparsity pattern (and a matrix in csc-format)
+    B = (A + random(200, 200, density=0.01, random_state=8)).tocsc()
+    assert np.allclose(solver(B, b), spsolve(B, b))
+    assert solver.nanalysis == 2
+
+    # a failed (non-finite) factorization is re-analysed on the next call
+    C = B.tocsr()
+    C.data[0] = np.nan
+    assert not np.all(np.isfinite(solver(C, b)))
+    assert np.allclose(solver(B, b), spsolve(B, b))
+    assert solver.nanalysis == 3
+
+    solver.free()
+
+    # fall back to pypardiso.spsolve without the private methods of pypardiso
+    solver.solver = object()
+    assert np.allclose(solver(A, b), spsolve(A, b))
+
+
+if __name__ == "__main__":
+    test_pardiso_solver()
@@ -2,7 +2,6 @@ import felupe as fem
 import matplotlib.pyplot as plt
 import numpy as np
 import termtables as tt
-from pypardiso import spsolve
 
 import fiberreinforcedrubber as frr
 
@@ -85,8 +84,11 @@ def test_specimen_amplitudes(path=".", take_screenshots=False):
     # setup boundary conditions
     bounds, loadcase = fem.dof.shear(field)
 
+    # linear solver with a re-used symbolic factorization for all steps
+    solver = frr.PardisoSolver()
+
     # constitutive material behavior for rubber and cord
-    neohooke, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
         C10=C10,
         fiber_angle=fiber_angle,
         fiber_modulus=fiber_modulus,
@@ -95,45 +97,67 @@ def test_specimen_amplitudes(path=".", take_screenshots=False):
         strain_exponent=strain_exponent,
         axis=fiber_axis,
         fiber_distance=fiber_distance,
+        fused=True,
     )
 
-    # solid bodies
-    rubber = fem.SolidBody(neohooke, field)
-    fiber1 = fem.SolidBody(fibermat1, field)
-    fiber2 = fem.SolidBody(fibermat2, field)
-
-    # tension and shear at V = 3 mm (Fy = 3 kN)
-
-    fiber_forces = [[], []]
+    # a solid body with the combined material of the rubber and both fiber families
+    solid = fem.SolidBody(material, field)
 
-    def evaluate_fiber_forces(i, j, substep):
-        field = substep.x
+    # projection operator from quadrature-points to mesh-points (for fiber forces)
+    projector = frr.Projector(region)
 
-        # get fiber normal forces per undeformed (fiber) area
-        force1 = frr.fiber_force(fiber1, thickness, fiber_area, vector1)
-        force2 = frr.fiber_force(fiber2, thickness, fiber_area, vector2)
+    # interpolation operators from the rubber mesh to the fiber families
+    interpolate_1 = frr.Interpolator(
+        mesh, fibers_1, mask_points_1, method="isoparametric"
+    )
+    interpolate_2 = frr.Interpolator(
+        mesh, fibers_2, mask_points_2, method="isoparametric"
+    )
 
-        # interpolate fiber forces to the line-meshes of the fiber families
-        r_1 = frr.interpolate(mesh, force1, fibers_1, mask_points_1)
-        r_2 = frr.interpolate(mesh, force2, fibers_2, mask_points_2)
+    # accumulate the fiber normal forces per undeformed (fiber) area (for the double
+    # amplitude between the first and the last substep), interpolated to the
+    # line-meshes of the fiber families
+    fiber_force_range = frr.FiberForceRange(
+        solid,
+        thickness,
+        fiber_area,
+        vectors=[vector1, vector2],
+        projector=projector,
+        umats=[fibermat1, fibermat2],
+        interpolators=[interpolate_1, interpolate_2],
+    )
 
-        fiber_forces[0].append(r_1)
-        fiber_forces[1].append(r_2)
+    # tension and shear at Fy = 3 kN (solve for the displacement V at U = -23 mm)
+    tension_3kN = frr.force_control(
+        field,
+        items=[solid],
+        boundaries=bounds,
+        boundary=bounds["compression_top"],
+        force=3e3 / thickness,
+        reaction=bounds["move"],
+        values={bounds["move"]: -lateral_max},
+        guess=[3, 4],
+        solver=solver,
+        tol=1e-2,
+    )
+    tension = tension_3kN["displacement"]
 
+    # lateral ramp at the constant displacement V
     step = fem.Step(
-        items=[rubber, fiber1, fiber2],
+        items=[solid],
         boundaries=bounds,
         ramp={
-            bounds["compression_top"]: fem.math.linsteps([3, 3], num=2),
+            bounds["compression_top"]: fem.math.linsteps([tension, tension], num=2),
             bounds["move"]: lateral_max * fem.math.linsteps([-1, 1], num=2),
         },
     )
-    job = fem.Job(steps=[step], callback=evaluate_fiber_forces)
-    job.evaluate(solver=spsolve, tol=1e-2)
+    # adaptive increments between the output points (with cutbacks on divergence)
+    job = fem.Job(steps=[step], plugins=[frr.AdaptiveSteps(), fiber_force_range])
+    job.evaluate(solver=solver, tol=1e-2)
 
     # interpolate displacements to the line-meshes of the fiber families
-    u_1 = frr.interpolate(mesh, field[0].values, fibers_1, mask_points_1)
-    u_2 = frr.interpolate(mesh, field[0].values, fibers_2, mask_points_2)
+    u_1 = interpolate_1(field[0].values)
+    u_2 = interpolate_2(field[0].values)
 
     # deformed line mesh for the fibers
     fibers_1.points += u_1
@@ -146,10 +170,10 @@ def test_specimen_amplitudes(path=".", take_screenshots=False):
 
     # view on fiber families
     fiberfamilies = [
-        (fiber_forces[0], fibers_1, fibers_2, [400, 900]),
-        (fiber_forces[1], fibers_2, fibers_1, [400, 900]),
+        (fiber_force_range.double_amplitude[0], fibers_1, fibers_2, [400, 900]),
+        (fiber_force_range.double_amplitude[1], fibers_2, fibers_1, [400, 900]),
     ]
-    for i, (fiberforce, fiberfamily1, fiberfamily2, clim) in enumerate(fiberfamilies):
+    for i, (forcerange, fiberfamily1, fiberfamily2, clim) in enumerate(fiberfamilies):
         view = fem.ViewSolid(field)
         plotter = view.plot(
             off_screen=True,
@@ -159,8 +183,6 @@ def test_specimen_amplitudes(path=".", take_screenshots=False):
         )
         plotter.add_axes(label_size=(0.06, 0.06))
 
-        forcerange = np.abs(fiberforce[-1] - fiberforce[-3])
-
         fiberview1 = fem.ViewMesh(
             fiberfamily1,
             point_data={
@@ -2,7 +2,6 @@ import felupe as fem
 import matplotlib.pyplot as plt
 import numpy as np
 import termtables as tt
-from pypardiso import spsolve
 
 import fiberreinforcedrubber as frr
 
@@ -85,8 +84,11 @@ def test_specimen_amplitudes_max_diff(path=".", take_screenshots=False):
     # setup boundary conditions
     bounds, loadcase = fem.dof.shear(field)
 
+    # linear solver with a re-used symbolic factorization for all steps
+    solver = frr.PardisoSolver()
+
     # constitutive material behavior for rubber and cord
-    neohooke, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
         C10=C10,
         fiber_angle=fiber_angle,
         fiber_modulus=fiber_modulus,
@@ -95,38 +97,58 @@ def test_specimen_amplitudes_max_diff(path=".", take_screenshots=False):
         strain_exponent=strain_exponent,
         axis=fiber_axis,
         fiber_distance=fiber_distance,
+        fused=True,
     )
 
-    # solid bodies
-    rubber = fem.SolidBody(neohooke, field)
-    fiber1 = fem.SolidBody(fibermat1, field)
-    fiber2 = fem.SolidBody(fibermat2, field)
-
-    fiber_forces = [[], []]
+    # a solid body with the combined material of the rubber and both fiber families
+    solid = fem.SolidBody(material, field)
+
+    # projection operator from quadrature-points to mesh-points (for fiber forces)
+    projector = frr.Projector(region)
+
+    # accumulate the fiber normal forces per undeformed (fiber) area (for the double
+    # amplitude between the first and the last substep)
+    fiber_force_range = frr.FiberForceRange(
+        solid,
+        thickness,
+        fiber_area,
+        vectors=[vector1, vector2],
+        projector=projector,
+        umats=[fibermat1, fibermat2],
+    )
 
-    def evaluate_fiber_forces(i, j, substep):
-        "Fiber normal forces per undeformed (fiber) area."
-        fiber_forces[0].append(frr.fiber_force(fiber1, thickness, fiber_area, vector1))
-        fiber_forces[1].append(frr.fiber_force(fiber2, thickness, fiber_area, vector2))
+    # tension and shear at Fy = 3 kN (solve for the displacement V at U = -23 mm)
+    tension_3kN = frr.force_control(
+        field,
+        items=[solid],
+        boundaries=bounds,
+        boundary=bounds["compression_top"],
+        force=3e3 / thickness,
+        reaction=bounds["move"],
+        values={bounds["move"]: -lateral_max},
+        guess=[3, 4],
+        solver=solver,
+        tol=1e-2,
+    )
+    tension = tension_3kN["displacement"]
 
-    # tension and shear at V = 3 mm (Fy = 3 kN)
+    # lateral ramp at the constant displacement V
     step = fem.Step(
-        items=[rubber, fiber1, fiber2],
+        items=[solid],
         boundaries=bounds,
         ramp={
-            bounds["compression_top"]: fem.math.linsteps([3, 3], num=2),
+            bounds["compression_top"]: fem.math.linsteps([tension, tension], num=2),
             bounds["move"]: lateral_max * fem.math.linsteps([-1, 1], num=2),
         },
     )
-    job = fem.Job(steps=[step], callback=evaluate_fiber_forces)
-    job.evaluate(solver=spsolve, tol=1e-2)
+    # adaptive increments between the output points (with cutbacks on divergence)
+    job = fem.Job(steps=[step], plugins=[frr.AdaptiveSteps(), fiber_force_range])
+    job.evaluate(solver=solver, tol=1e-2)
 
     # %% postprocessing
 
-    max_force_range = np.maximum(
-        np.abs(fiber_forces[0][-1] - fiber_forces[0][-3]),
-        np.abs(fiber_forces[1][-1] - fiber_forces[1][-3]),
-    )
+    max_force_range = fiber_force_range.max_double_amplitude
+    force_difference = np.abs(fiber_force_range.force[0] - fiber_force_range.force[1])
 
     # Deformed Views
     # --------------
@@ -153,7 +175,7 @@ def test_specimen_amplitudes_max_diff(path=".", take_screenshots=False):
     # view of max. fiber force difference
     view = fem.ViewField(
         field,
-        point_data={"ForceDiff": np.abs(fiber_forces[0][-1] - fiber_forces[1][-1])},
+        point_data={"ForceDiff": force_difference},
     )
     plotter = view.plot(
         "ForceDiff",
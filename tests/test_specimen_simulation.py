@@ -2,7 +2,6 @@ import felupe as fem
 import matplotlib.pyplot as plt
 import numpy as np
 import termtables as tt
-from pypardiso import spsolve
 
 import fiberreinforcedrubber as frr
 
@@ -85,6 +84,9 @@ def test_specimen_simulation(path=".", take_screenshots=False):
     # setup boundary conditions
     bounds, loadcase = fem.dof.shear(field)
 
+    # linear solver with a re-used symbolic factorization for all steps
+    solver = frr.PardisoSolver()
+
     # constitutive material behavior for rubber and cord
     neohooke, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
         C10=C10,
@@ -102,6 +104,9 @@ def test_specimen_simulation(path=".", take_screenshots=False):
     fiber1 = fem.SolidBody(fibermat1, field)
     fiber2 = fem.SolidBody(fibermat2, field)
 
+    # projection operator from quadrature-points to mesh-points (for fiber forces)
+    projector = frr.Projector(region)
+
     # tension
     step1 = fem.Step(
         items=[rubber, fiber1, fiber2],
@@ -115,7 +120,7 @@ def test_specimen_simulation(path=".", take_screenshots=False):
     )
 
     tension = fem.CharacteristicCurve(steps=[step1], boundary=bounds["move"])
-    tension.evaluate(solver=spsolve, tol=1e-2)
+    tension.evaluate(solver=solver, tol=1e-2)
 
     # tension and shear
     step2 = fem.Step(
@@ -132,32 +137,42 @@ def test_specimen_simulation(path=".", take_screenshots=False):
     )
 
     tensionshear = fem.CharacteristicCurve(steps=[step2], boundary=bounds["move"])
-    tensionshear.evaluate(solver=spsolve, tol=1e-2)
+    tensionshear.evaluate(solver=solver, tol=1e-2)
 
-    # tension and shear at Fy = 3 kN
-    step3 = fem.Step(
+    # tension and shear at Fy = 3 kN (solve for the displacement V)
+    tensionshear_3kN = frr.force_control(
+        field,
         items=[rubber, fiber1, fiber2],
         boundaries=bounds,
-        ramp={
-            bounds["compression_top"]: fem.math.linsteps([3], num=0),
-            bounds["move"]: fem.math.linsteps([lateral_max], num=0),
-        },
+        boundary=bounds["compression_top"],
+        force=3e3 / thickness,
+        reaction=bounds["move"],
+        values={bounds["move"]: lateral_max},
+        guess=[3, 4],
+        solver=solver,
+        tol=1e-2,
     )
-
-    tensionshear_3kN = fem.CharacteristicCurve(steps=[step3], boundary=bounds["move"])
-    tensionshear_3kN.evaluate(solver=spsolve, tol=1e-2)
+    assert np.isclose(tensionshear_3kN["force"][1] * thickness, 3e3, rtol=1e-4)
 
     # get fiber normal forces per undeformed (fiber) area
-    force1 = frr.fiber_force(fiber1, thickness, fiber_area, vector1)
-    force2 = frr.fiber_force(fiber2, thickness, fiber_area, vector2)
+    force1 = frr.fiber_force(fiber1, thickness, fiber_area, vector1, projector)
+    force2 = frr.fiber_force(fiber2, thickness, fiber_area, vector2, projector)
+
+    # interpolation operators from the rubber mesh to the fiber families
+    interpolate_1 = frr.Interpolator(
+        mesh, fibers_1, mask_points_1, method="isoparametric"
+    )
+    interpolate_2 = frr.Interpolator(
+        mesh, fibers_2, mask_points_2, method="isoparametric"
+    )
 
     # interpolate displacements to the line-meshes of the fiber families
-    u_1 = frr.interpolate(mesh, field[0].values, fibers_1, mask_points_1)
-    u_2 = frr.interpolate(mesh, field[0].values, fibers_2, mask_points_2)
+    u_1 = interpolate_1(field[0].values)
+    u_2 = interpolate_2(field[0].values)
 
     # interpolate fiber forces to the line-meshes of the fiber families
-    r_1 = frr.interpolate(mesh, force1, fibers_1, mask_points_1)
-    r_2 = frr.interpolate(mesh, force2, fibers_2, mask_points_2)
+    r_1 = interpolate_1(force1)
+    r_2 = interpolate_2(force2)
 
     # deformed line mesh for the fibers
     fibers_1.points += u_1
@@ -204,6 +219,15 @@ def test_specimen_simulation(path=".", take_screenshots=False):
         color="C2",
     )
 
+    # the solved state at Fy = 3 kN
+    ax[0].plot(
+        tensionshear_3kN["displacement"],
+        tensionshear_3kN["force"][1] * 1e-3 * thickness,
+        "o",
+        color="C0",
+        label=rf"$F_Y = 3$ kN ($V = {tensionshear_3kN['displacement']:.2f}$ mm)",
+    )
+
     ax[0].legend()
     [axis.grid(True) for axis in ax]
 
@@ -0,0 +1,123 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_stepping():
+    kwargs = dict(
+        tension_max=8,
+        lateral_max=23,
+        tol=1e-6,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )
+
+    # uniform substeps and adaptive increments between two output points
+    res = frr.simulate_test_specimen(num=8, **kwargs)
+    adaptive = frr.AdaptiveSteps()
+    res_adaptive = frr.simulate_test_specimen(num=2, adaptive=adaptive, **kwargs)
+
+    assert np.allclose(res_adaptive["displacement"], [0, 4, 8])
+    assert any(len(load_factors) > 1 for load_factors in adaptive.load_factors)
+
+    for label in ["force_tension", "force_tensionshear", "force_lateral"]:
+        assert np.allclose(res_adaptive[label], res[label][::4], rtol=1e-4)
+
+
+def test_stepping_cutback():
+    mesh = frr.create_test_specimen(n=11, size=2.5)[0]
+    field = fem.FieldContainer([fem.Field(fem.RegionQuad(mesh), dim=2)])
+    bounds, loadcase = fem.dof.shear(field)
+    solid = fem.SolidBody(frr.fiber_reinforced_rubber(fused=True)[0], field)
+
+    # a tension of 8 mm and a lateral displacement of 40 mm in one substep
+    step = fem.Step(
+        items=[solid],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: np.array([8.0]),
+            bounds["move"]: np.array([40.0]),
+        },
+    )
+    kwargs = dict(solver=frr.PardisoSolver(), verbose=0, tol=1e-6, maxiter=8)
+
+    try:
+        fem.Job(steps=[step]).evaluate(**kwargs)
+        converged = True
+    except fem.NewtonConvergenceError:
+        converged = False
+
+    assert not converged
+
+    # the failed substep is subdivided and hits the output point exactly
+    field[0].values[:] = 0
+    bounds["compression_top"].update(0)
+    bounds["move"].update(0)
+    adaptive = frr.AdaptiveSteps()
+    curve = fem.CharacteristicCurve(
+        steps=[step], boundary=bounds["move"], plugins=[adaptive]
+    )
+    curve.evaluate(**kwargs)
+
+    assert adaptive.cutbacks[-1] > 0
+    assert len(adaptive.load_factors[-1]) > 1
+    assert adaptive.load_factors[-1][-1] == 1
+    assert np.allclose(curve.x, [[40, 8]])
+    assert np.allclose(field[0].values[bounds["move"].points], [40, 8])
+
+
+def test_stepping_cutback_limit():
+    mesh = frr.create_test_specimen(n=11, size=2.5)[0]
+    field = fem.FieldContainer([fem.Field(fem.RegionQuad(mesh), dim=2)])
+    bounds, loadcase = fem.dof.shear(field)
+    solid = fem.SolidBody(frr.fiber_reinforced_rubber(fused=True)[0], field)
+
+    # a tension of 8 mm and a lateral displacement of 80 mm in the second substep
+    step = fem.Step(
+        items=[solid],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: np.array([0.0, 8.0]),
+            bounds["move"]: np.array([0.0, 80.0]),
+        },
+    )
+    kwargs = dict(solver=frr.PardisoSolver(), verbose=0, tol=1e-6, maxiter=8)
+
+    # the cutbacks are exhausted in the last increment or before the last increment
+    for adaptive in [
+        frr.AdaptiveSteps(max_cutbacks=0),
+        frr.AdaptiveSteps(increment=70, max_cutbacks=0),
+    ]:
+        field[0].values[:] = 0
+        bounds["compression_top"].update(0)
+        bounds["move"].update(0)
+        values = []
+
+        def store(context, state):
+            values.append(field[0].values.copy())
+
+        try:
+            fem.Job(steps=[step], plugins=[adaptive, store]).evaluate(**kwargs)
+            converged = True
+        except fem.NewtonConvergenceError as error:
+            converged = False
+            assert "Adaptive steps failed" in str(error)
+
+        assert not converged
+        assert len(values) == 1
+        assert adaptive.cutbacks[-1] > 0
+
+        # the state of the converged output point is restored
+        assert np.allclose(field[0].values, values[0])
+        assert np.allclose(bounds["move"].value, 0)
+
+
+if __name__ == "__main__":
+    test_stepping()
+    test_stepping_cutback()
+    test_stepping_cutback_limit()
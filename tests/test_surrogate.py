@@ -0,0 +1,76 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_surrogate():
+    kwargs = dict(
+        tension_max=4,
+        lateral_max=10,
+        tol=1e-6,
+        size=2.5,
+        size_middle=0.5,
+        size_radius=1.25,
+        bias=4,
+        bias_radius=4,
+        bias_tangential=4,
+    )
+
+    surrogate = frr.Surrogate({"fiber_angle": (10, 30)}, **kwargs)
+    design = surrogate.design(8, seed=1)
+
+    assert len(design) == 8
+    assert np.all([10 <= p["fiber_angle"] <= 30 for p in design])
+
+    surrogate.train(8, seed=1, processes=2)
+
+    # a predicted curve inside of the box
+    res = frr.simulate_test_specimen(fiber_angle=17, **kwargs)
+    prediction = surrogate.predict(fiber_angle=17)
+
+    assert prediction["inside"]
+    assert np.allclose(prediction["displacement"], res["displacement"])
+
+    for key in ["force_tension", "force_tensionshear", "force_lateral"]:
+        scale = np.abs(res[key]).max()
+        assert np.abs(prediction[key] - res[key]).max() < 2e-2 * scale
+        assert np.all(prediction[f"{key}_std"] < 2e-2 * scale)
+
+    # many parameter sets at once, one of them outside of the box
+    angles = np.linspace(10, 30, 101)
+    predictions = surrogate.predict(fiber_angle=angles, fallback=False)
+
+    assert predictions["force_lateral"].shape == (101, 5)
+    assert np.all(predictions["inside"])
+    assert not surrogate.inside(fiber_angle=35)[0]
+
+    # a parameter set outside of the box is evaluated by the simulation
+    res = frr.simulate_test_specimen(fiber_angle=35, **kwargs)
+    prediction = surrogate.predict(fiber_angle=35)
+
+    assert not prediction["inside"]
+    assert np.allclose(prediction["force_lateral"], res["force_lateral"])
+    assert np.all(prediction["force_lateral_std"] == 0)
+
+    # other parameters than those of the box are evaluated by the simulation
+    assert surrogate.inside(fiber_angle=17, tension_max=4)[0]
+    assert not surrogate.inside(fiber_angle=17, radius=22)[0]
+
+    res = frr.simulate_test_specimen(fiber_angle=17, radius=22, **kwargs)
+    prediction = surrogate.predict(fiber_angle=17, radius=22, tension_max=4)
+
+    assert not prediction["inside"]
+    assert np.allclose(prediction["force_lateral"], res["force_lateral"])
+
+    # a simulated curve of another length (number of substeps)
+    try:
+        surrogate.predict(fiber_angle=17, tension_max=2)
+        raised = False
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+if __name__ == "__main__":
+    test_surrogate()
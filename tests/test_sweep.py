@@ -0,0 +1,50 @@
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def test_sweep():
+    # a grid of parameter sets (the last one fails)
+    parameters = frr.parameter_grid(fiber_angle=[15, 30], tension_max=[1, 2])
+    parameters.append(dict(fiber_angle=15, tension_max=2, radius=-1))
+
+    results = frr.sweep(parameters, processes=2, threads=1, lateral_max=5)
+
+    assert np.all(results["success"] == [True, True, True, True, False])
+    assert len(results["error"][-1]) > 0
+    assert np.allclose(results["fiber_angle"][:4], [15, 15, 30, 30])
+    assert results["force_tension"].shape == (5, 3)
+
+    # results of different lengths and of failed parameter sets are filled with NaN
+    assert np.all(np.isnan(results["force_tension"][[0, 2, 4], -1]))
+    assert np.all(results["force_tension"][[1, 3], -1] > 0)
+
+    # a stiffer fiber-reinforcement for smaller fiber angles
+    assert results["force_tension"][1, -1] > results["force_tension"][3, -1]
+
+
+def fun(size):
+    "An evaluation which returns a scalar NaN (or raises) instead of an array."
+
+    if size < 0:
+        raise ValueError("The size must not be negative.")
+
+    if size == 0:
+        return {"values": np.nan}
+
+    return {"values": np.arange(size, dtype=float)}
+
+
+def test_sweep_shapes():
+    results = frr.sweep([dict(size=n) for n in [2, 0, 3, -1]], fun=fun, processes=0)
+
+    assert np.all(results["success"] == [True, True, True, False])
+    assert results["values"].shape == (4, 3)
+    assert np.allclose(results["values"][0, :2], [0, 1])
+    assert np.allclose(results["values"][2], [0, 1, 2])
+    assert np.all(np.isnan(results["values"][[1, 3]]))
+
+
+if __name__ == "__main__":
+    test_sweep()
+    test_sweep_shapes()
@@ -0,0 +1,82 @@
+import felupe as fem
+import numpy as np
+
+import fiberreinforcedrubber as frr
+
+
+def solve(half, tension=2, lateral=5):
+    "Solve the test specimen (or the upper half) under tension and shear."
+
+    mesh = frr.create_test_specimen(n=11, size=2.5, half=half)[0]
+    field = fem.FieldContainer([fem.Field(fem.RegionQuad(mesh), dim=2)])
+
+    if half:
+        top = mesh.points[:, 1].max()
+        bounds = {
+            "compression_top": fem.Boundary(field[0], fy=top, skip=(1, 0)),
+            "move": fem.Boundary(field[0], fy=top, skip=(0, 1)),
+        }
+        constraints = [frr.PointSymmetry(field)]
+    else:
+        bounds, loadcase = fem.dof.shear(field)
+        constraints = []
+
+    material, fibermat1, fibermat2, vector1, vector2 = frr.fiber_reinforced_rubber(
+        fused=True
+    )
+    solid = fem.SolidBody(material, field)
+    step = fem.Step(
+        items=[solid, *constraints],
+        boundaries=bounds,
+        ramp={
+            bounds["compression_top"]: fem.math.linsteps([0, tension], num=2),
+            bounds["move"]: fem.math.linsteps([0, lateral], num=2),
+        },
+    )
+    curve = fem.CharacteristicCurve(steps=[step], boundary=bounds["move"])
+    curve.evaluate(solver=frr.PardisoSolver(), tol=1e-8, verbose=False)
+
+    force = frr.fiber_force(solid, 5, 0.08, vector1, umat=fibermat1)
+
+    return mesh, field, force, np.array(curve.y), constraints
+
+
+def sort(points, values):
+    "Sort values by the (rounded) coordinates of the points."
+
+    order = np.lexsort(np.round(points, 6).T)
+    return values[order]
+
+
+def test_symmetry():
+    mesh, field, force, reaction, constraints = solve(half=False)
+    half, field_half, force_half, reaction_half, [symmetry] = solve(half=True)
+
+    # the half model has approx. half of the points
+    assert half.npoints < mesh.npoints * 0.55
+
+    # the reaction forces of the top edge are equal
+    assert np.allclose(reaction_half, reaction, rtol=1e-4)
+
+    # the results are reconstructed on the full test specimen
+    assert symmetry.mesh.npoints == mesh.npoints
+    assert np.allclose(
+        sort(symmetry.mesh.points, symmetry.mesh.points), sort(mesh.points, mesh.points)
+    )
+
+    u = symmetry.reconstruct(field_half[0].values, displacement=True)
+    assert np.allclose(
+        sort(symmetry.mesh.points, u), sort(mesh.points, field[0].values), atol=1e-3
+    )
+
+    f = symmetry.reconstruct(force_half)
+    assert np.allclose(
+        sort(symmetry.mesh.points, f), sort(mesh.points, force), rtol=0.05, atol=1
+    )
+
+    # the cells of the full test specimen have positive volumes
+    assert np.all(fem.RegionQuad(symmetry.mesh).dV > 0)
+
+
+if __name__ == "__main__":
+    test_symmetry()